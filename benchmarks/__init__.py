@@ -0,0 +1,27 @@
+"""
+Benchmarks for slippers' hot paths.
+
+Run a benchmark module against the test settings from the repository root, e.g.:
+
+    python -m benchmarks.front_matter
+
+`benchmarks.suite` runs all microbenchmarks and can write their results to a JSON file, and `benchmarks.compare`
+compares two such files.
+"""
+
+import os
+import timeit
+from typing import Callable
+
+
+def setup_django():
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+
+    import django
+
+    django.setup()
+
+
+def measure(func: Callable[[], object], number: int = 1000, repeat: int = 5) -> float:
+    """Return the best time per call in microseconds"""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1_000_000
@@ -0,0 +1,53 @@
+"""
+Compare two result files written by `python -m benchmarks.suite --output`.
+
+    python -m benchmarks.compare before.json after.json
+
+Exits with status 1 if any benchmark got slower by more than the threshold.
+"""
+
+import argparse
+import json
+import sys
+
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("before")
+    parser.add_argument("after")
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="Relative slowdown reported as a regression (default: 0.1)"
+    )
+    args = parser.parse_args()
+
+    before, after = load_results(args.before), load_results(args.after)
+    print(f"before: {before['metadata']['commit']}  after: {after['metadata']['commit']}\n")
+
+    regressions = []
+    for name in sorted(before["results"].keys() | after["results"].keys()):
+        old, new = before["results"].get(name), after["results"].get(name)
+        if old is None or new is None:
+            print(f"{name:40} {'only in ' + ('after' if old is None else 'before'):>36}")
+            continue
+
+        change = new / old - 1
+        flag = ""
+        if change > args.threshold:
+            flag = "  slower"
+            regressions.append(name)
+        elif change < -args.threshold:
+            flag = "  faster"
+
+        print(f"{name:40} {old:12.2f}us {new:12.2f}us {change:+8.1%}{flag}")
+
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Per-render cost of evaluating component front matter.
+
+"before" replays the previous behaviour of exec'ing the raw front matter source (plus a `typing` star-import) on every
+render. "after" executes the cached code object.
+"""
+
+from benchmarks import measure, setup_django
+
+setup_django()
+
+from django.template import Context, Template  # noqa: E402
+from django.template.loader import get_template  # noqa: E402
+
+from slippers.components import extract_template_parts  # noqa: E402
+from slippers.props import Props  # noqa: E402
+
+
+def from_string_uncached(attributes, code):
+    props = Props(attributes, {}, {})
+    exec(f"from typing import *\n{code}", {}, {"props": props})
+    return props
+
+
+def main():
+    component = get_template("component_code.html").template
+    front_matter = extract_template_parts(component.source)[0]
+    attributes = {"required_string": "Hello"}
+
+    before = measure(lambda: from_string_uncached(attributes, front_matter))
+    after = measure(lambda: Props.from_string(attributes, front_matter, component.origin.name))
+
+    print(f"Props.from_string   before: {before:8.2f}us  after: {after:8.2f}us  ({before / after:.1f}x)")
+
+    template = Template('{% component_code required_string="Hello" %}')
+    context = Context()
+    render = measure(lambda: template.render(context))
+
+    print(f"component render    {render:8.2f}us")
+
+
+if __name__ == "__main__":
+    main()
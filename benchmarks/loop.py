@@ -0,0 +1,28 @@
+"""
+Rendering a component for each row of a large table: a `{% for %}` loop around the component, compared with the
+component's own loop form.
+"""
+
+from benchmarks import measure, setup_django
+
+setup_django()
+
+from django.template import Context, Template  # noqa: E402
+
+ROWS = [{"name": f"row {i}", "score": i} for i in range(5000)]
+
+
+def main():
+    for_loop = Template("{% for row in rows %}{% table_row name=row.name score=row.score %}{% endfor %}")
+    component_loop = Template("{% table_row for row in rows name=row.name score=row.score %}")
+
+    assert for_loop.render(Context({"rows": ROWS})) == component_loop.render(Context({"rows": ROWS}))
+
+    before = measure(lambda: for_loop.render(Context({"rows": ROWS})), number=5, repeat=3)
+    after = measure(lambda: component_loop.render(Context({"rows": ROWS})), number=5, repeat=3)
+
+    print(f"5,000 rows    for loop: {before / 1000:8.2f}ms  component loop: {after / 1000:8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
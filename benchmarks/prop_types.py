@@ -0,0 +1,47 @@
+"""
+Cost of checking a component's props against its types.
+
+"typeguard" calls typeguard's check_type for every prop, as check_prop_types used to. "compiled" uses the cached
+validator check_prop_types now builds from the types.
+"""
+
+from benchmarks import measure, setup_django
+
+setup_django()
+
+from typing import List, Optional, Union  # noqa: E402
+
+from typeguard import check_type  # noqa: E402
+
+from slippers.props import check_prop_types  # noqa: E402
+
+TYPES = {
+    "string": str,
+    "number": int,
+    "list_of_numbers": List[int],
+    "optional_string": Optional[str],
+    "string_or_number": Union[str, int],
+}
+ATTRIBUTES = {"string": "Hello", "number": 10, "list_of_numbers": [1, 2, 3], "string_or_number": "ten"}
+
+
+def check_with_typeguard():
+    for name, actual in ATTRIBUTES.items():
+        if name in TYPES:
+            try:
+                check_type(name, actual, TYPES[name])
+            except TypeError:
+                pass
+
+
+def main():
+    typeguard = measure(check_with_typeguard)
+    compiled = measure(lambda: check_prop_types(attributes=ATTRIBUTES, types=TYPES, defaults={}))
+
+    print(
+        f"check_prop_types    typeguard: {typeguard:8.2f}us  compiled: {compiled:8.2f}us  ({typeguard / compiled:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
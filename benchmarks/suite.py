@@ -0,0 +1,183 @@
+"""
+Microbenchmarks for slippers' hot paths, with results that can be compared between commits.
+
+    python -m benchmarks.suite --output before.json
+    git checkout my-branch
+    python -m benchmarks.suite --output after.json
+    python -m benchmarks.compare before.json after.json
+
+Results are the best time per call, in microseconds.
+"""
+
+from benchmarks import measure, setup_django
+
+setup_django()
+
+import argparse  # noqa: E402
+import json  # noqa: E402
+import platform  # noqa: E402
+import subprocess  # noqa: E402
+from datetime import datetime, timezone  # noqa: E402
+from typing import Callable, Dict, Optional  # noqa: E402
+
+import django  # noqa: E402
+from django.template import Context, Engine, Template  # noqa: E402
+from django.template.base import Parser  # noqa: E402
+from django.test import override_settings  # noqa: E402
+
+from benchmarks.tree import generate_tree, tree_engine  # noqa: E402
+from slippers.props import Props, check_prop_types  # noqa: E402
+from slippers.template import SlippersFilterExpression  # noqa: E402
+
+BENCHMARKS: Dict[str, Callable[[], float]] = {}
+
+TYPE_CHECKING_PROPS = {
+    "string": "Hello",
+    "number": 10,
+    "list_of_numbers": [1, 2, 3],
+    "optional_string": None,
+    "string_or_number": "ten",
+}
+
+FRONT_MATTER = """
+props.types = {
+    'string': str,
+    'number': int,
+    'list_of_numbers': List[int],
+    'optional_string': Optional[str],
+    'string_or_number': Union[str, int],
+}
+props.defaults = {'optional_string': 'default'}
+props['doubled'] = props['number'] * 2
+"""
+
+
+def benchmark(func: Callable[[], float]) -> Callable[[], float]:
+    BENCHMARKS[func.__name__] = func
+    return func
+
+
+def render_time(template: Template, context: Optional[dict] = None, number: int = 1000) -> float:
+    return measure(lambda: template.render(Context(context)), number=number)
+
+
+@benchmark
+def component_inline():
+    return render_time(Template('{% avatar user="mixxorz" %}'))
+
+
+@benchmark
+def component_block():
+    return render_time(Template('{% #card heading="Hello" %}<p>Body</p>{% /card %}'))
+
+
+@benchmark
+def component_front_matter():
+    template = Template("{% type_checking string=string number=number list_of_numbers=list_of_numbers %}")
+    with override_settings(SLIPPERS_RUNTIME_TYPE_CHECKING=False):
+        return render_time(template, TYPE_CHECKING_PROPS)
+
+
+@benchmark
+def component_front_matter_type_checked():
+    template = Template("{% type_checking string=string number=number list_of_numbers=list_of_numbers %}")
+    with override_settings(SLIPPERS_RUNTIME_TYPE_CHECKING=True):
+        return render_time(template, TYPE_CHECKING_PROPS)
+
+
+@benchmark
+def nesting_deep():
+    # 30 components, each nested in the previous one
+    engine = tree_engine(generate_tree(depth=30, breadth=1))
+    return render_time(engine.get_template("page.html"), number=100)
+
+
+@benchmark
+def nesting_wide():
+    # 111 components, over three levels
+    engine = tree_engine(generate_tree(depth=3, breadth=10, front_matter=True))
+    with override_settings(SLIPPERS_RUNTIME_TYPE_CHECKING=True):
+        return render_time(engine.get_template("page.html"), number=100)
+
+
+@benchmark
+def list_wide():
+    template = Template("{% for user in users %}{% avatar user=user %}{% endfor %}")
+    return render_time(template, {"users": [f"user {i}" for i in range(1000)]}, number=10)
+
+
+@benchmark
+def attrs():
+    template = Template("<div {% attrs id class disabled aria-label x-bind:class %}></div>")
+    context = {"id": "main", "class": "card", "disabled": True, "aria-label": "Main", "x-bind:class": "open"}
+    return render_time(template, context)
+
+
+@benchmark
+def match_filter():
+    template = Template('{{ variant|match:"primary:btn-primary,secondary:btn-secondary,danger:btn-danger" }}')
+    return render_time(template, {"variant": "danger"})
+
+
+@benchmark
+def props_from_string():
+    return measure(lambda: Props.from_string(TYPE_CHECKING_PROPS, FRONT_MATTER))
+
+
+@benchmark
+def prop_types_check():
+    types = {
+        "string": str,
+        "number": int,
+        "list_of_numbers": list,
+        "optional_string": Optional[str],
+    }
+    return measure(lambda: check_prop_types(attributes=TYPE_CHECKING_PROPS, types=types, defaults={}))
+
+
+@benchmark
+def filter_expression_parse():
+    parser = Parser([], builtins=Engine.get_default().template_builtins)
+    return measure(lambda: SlippersFilterExpression("x-bind:class|default:'hidden'|upper", parser))
+
+
+def get_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filter", default="", help="Only run benchmarks whose name contains this")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    args = parser.parse_args()
+
+    results = {}
+    for name, func in BENCHMARKS.items():
+        if args.filter in name:
+            results[name] = func()
+            print(f"{name:40} {results[name]:12.2f}us")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "metadata": {
+                        "commit": get_commit(),
+                        "python": platform.python_version(),
+                        "django": django.get_version(),
+                        "date": datetime.now(timezone.utc).isoformat(),
+                    },
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Synthetic component trees, for benchmarking renders of any depth and breadth.
+"""
+
+from typing import Dict
+
+from django.template import Engine, Library
+
+from slippers.templatetags.slippers import register_components
+
+FRONT_MATTER = """---
+props.types = {'label': str, 'index': int}
+props.defaults = {'index': 0}
+---
+"""
+
+
+def generate_tree(depth: int, breadth: int, front_matter: bool = False) -> Dict[str, str]:
+    """
+    Return template sources for a tree of components, by template name.
+
+    There is a component per level, each rendering `breadth` components of the next level around its children, and a
+    `page.html` that renders the first level. A page render renders `breadth ** level` components at each level.
+    """
+    templates = {"page.html": '{% level_0 label="root" %}'}
+
+    for level in range(depth):
+        header = FRONT_MATTER if front_matter else ""
+
+        if level == depth - 1:
+            body = "<span>{{ label }} {{ index }}</span>"
+        else:
+            items = "".join(
+                f"{{% #level_{level + 1} label=label index={index} %}}{index}{{% /level_{level + 1} %}}"
+                for index in range(breadth)
+            )
+            body = f'<div class="level-{level}">{items}{{{{ children }}}}</div>'
+
+        templates[f"level_{level}.html"] = header + body
+
+    return templates
+
+
+def tree_engine(templates: Dict[str, str]) -> Engine:
+    """Return an engine that loads `templates` from memory, with a component tag registered for each level"""
+    library = Library()
+    register_components(
+        {name[: -len(".html")]: name for name in templates if name.startswith("level_")},
+        library,
+    )
+
+    engine = Engine(
+        loaders=[("django.template.loaders.cached.Loader", [("django.template.loaders.locmem.Loader", templates)])],
+        builtins=["slippers.templatetags.slippers"],
+    )
+    engine.template_builtins.append(library)
+
+    return engine
@@ -0,0 +1,10 @@
+from typing import Optional
+
+from django.utils.safestring import SafeString
+
+
+def render_component(name: str, children: Optional[str] = None, **props) -> SafeString:
+    """Render a registered component from Python, as `{% name prop=value %}` would in a template"""
+    from slippers.templatetags.slippers import render_component
+
+    return render_component(name, children, **props)
@@ -1,27 +1,114 @@
+import gc
+import logging
+import time
 from pathlib import Path, PosixPath
+from typing import Set
 
 import yaml
 from django.apps import AppConfig
 from django.core.checks import Warning, register
+from django.core.signals import setting_changed
+from django.template import engines
+from django.template.backends.django import DjangoTemplates
 from django.template.exceptions import TemplateDoesNotExist
 from django.template.loader import select_template
 from django.utils.autoreload import autoreload_started, file_changed
 
-from slippers.templatetags.slippers import register_components
+from slippers.cache import reset_component_cache
+from slippers.components import evict_tag_dependents, reload_template, reset_component_templates
+from slippers.conf import settings
+from slippers.metrics import reset_sinks
+from slippers.templatetags.slippers import component_registry, register_components
+
+logger = logging.getLogger("slippers")
 
 
 def get_components_yaml():
     return select_template(["components.yaml", "components.yml"])
 
 
+def get_components():
+    """Return the components declared in components.yaml"""
+    template = get_components_yaml()
+    return yaml.safe_load(template.template.source).get("components", {})
+
+
+# Names of the components registered from components.yaml, to tell which were removed from it when it's reloaded
+yaml_component_names: Set[str] = set()
+
+
 def register_tags():
-    """Register tags from components.yaml"""
+    """Register tags from components.yaml, and forget components that were removed from it"""
     try:
-        template = get_components_yaml()
-        components = yaml.safe_load(template.template.source)
-        register_components(components.get("components", {}))
+        components = get_components()
     except TemplateDoesNotExist:
-        pass
+        return
+
+    for name in yaml_component_names - components.keys():
+        component_registry.pop(name, None)
+
+    yaml_component_names.clear()
+    yaml_component_names.update(components)
+
+    register_components(components)
+
+
+def load_compiled_components():
+    """Load front matter compiled by `manage.py slippers_compile`"""
+    from slippers.build import load_build
+
+    path = settings.SLIPPERS_COMPILED_COMPONENTS
+    if not path:
+        return
+
+    try:
+        loaded = load_build(path)
+    except FileNotFoundError:
+        logger.warning("Compiled components not found at %s. Run `manage.py slippers_compile` to create them.", path)
+        return
+    except (EOFError, ValueError, TypeError):
+        # Left truncated or corrupted, for example by an interrupted deploy
+        logger.warning(
+            "Compiled components at %s couldn't be read and weren't loaded. "
+            "Run `manage.py slippers_compile` to compile them again.",
+            path,
+        )
+        return
+
+    if loaded is None:
+        logger.warning(
+            "Compiled components at %s were compiled by another version of Python and weren't loaded. "
+            "Run `manage.py slippers_compile` to compile them again.",
+            path,
+        )
+
+
+def warm_up_components():
+    """Load and compile every registered component ahead of the first request"""
+    from slippers.build import compile_components
+
+    try:
+        components = get_components()
+    except TemplateDoesNotExist:
+        return
+
+    start = time.perf_counter()
+    templates = 0
+
+    for backend in engines.all():
+        if not isinstance(backend, DjangoTemplates):
+            continue
+
+        build = compile_components(components, backend.engine)
+        templates += build.templates
+
+        for error in build.errors:
+            logger.warning(error)
+
+    if settings.SLIPPERS_WARMUP_FREEZE_GC:
+        gc.freeze()
+
+    logger.info("Warmed up %s component templates in %.1fms", templates, (time.perf_counter() - start) * 1000)
 
 
 def watch(sender, **kwargs):
@@ -33,12 +120,46 @@ def watch(sender, **kwargs):
         pass
 
 
+def get_component_definitions():
+    """Return what each registered component tag renders, to tell which tags a components.yaml change affects"""
+    return {name: (node.template_path, node.pure, node.dedupe) for name, node in component_registry.items()}
+
+
 def changed(sender, file_path: PosixPath, **kwargs):
-    """Refresh tag registry when component.yaml changes"""
+    """Refresh tag registry when component.yaml changes and forget resolved component templates"""
+    if file_path.suffix == ".py":
+        return None
+
+    fine_grained = settings.SLIPPERS_FINE_GRAINED_RELOAD
+
+    if fine_grained:
+        # Stands in for Django's handler, which clears every cached template and is disconnected in this mode
+        is_template = reload_template(file_path)
+    else:
+        reset_component_templates()
+        is_template = None
+
     if file_path.name == "components.yaml":
         print("components.yaml changed. Updating component tags...")
+        before = get_component_definitions()
         register_tags()
 
+        if fine_grained:
+            after = get_component_definitions()
+            evict_tag_dependents(name for name in before.keys() | after.keys() if before.get(name) != after.get(name))
+
+    return is_template
+
+
+def settings_changed(setting, **kwargs):
+    """Forget resolved component templates, cached output, and metrics sinks when their settings change"""
+    if setting == "TEMPLATES":
+        reset_component_templates()
+    elif setting in ("SLIPPERS_COMPONENT_CACHE", "SLIPPERS_COMPONENT_CACHE_SIZE", "CACHES"):
+        reset_component_cache()
+    elif setting == "SLIPPERS_METRICS":
+        reset_sinks()
+
 
 def checks(app_configs, **kwargs):
     """Warn if unable to find components.yaml"""
@@ -60,8 +181,16 @@ class SlippersConfig(AppConfig):
 
     def ready(self):
         register_tags()
+        load_compiled_components()
+
+        if settings.SLIPPERS_WARMUP:
+            warm_up_components()
 
         register(checks)
 
         autoreload_started.connect(watch)
         file_changed.connect(changed)
+
+        if settings.SLIPPERS_FINE_GRAINED_RELOAD:
+            file_changed.disconnect(dispatch_uid="template_loaders_file_changed")
+        setting_changed.connect(settings_changed)
@@ -0,0 +1,68 @@
+"""
+Async template rendering.
+
+Component front matter can `await`, for example to load data with the async ORM:
+
+    ---
+    props["author"] = await User.objects.aget(pk=props["author_id"])
+    ---
+
+Rendering a template with `arender_template` from an async view runs the front matter of sibling components
+concurrently:
+
+    async def dashboard(request):
+        return HttpResponse(await arender_template("dashboard.html", {"widgets": widgets}, request))
+
+Templates are walked the way `slippers.streaming` walks them. Components with front matter that awaits, and the
+components around them, are deferred and awaited together once the rest of the template has rendered. Everything
+else renders synchronously in a thread, where the ORM and other synchronous code can be used as usual.
+
+Templates rendered synchronously run front matter that awaits to completion with `async_to_sync`.
+"""
+
+import asyncio
+import inspect
+from typing import Any, Dict, List, Optional, Union
+
+from asgiref.sync import sync_to_async
+from django.template import Template
+from django.template.context import make_context
+from django.template.loader import get_template
+from django.utils.safestring import SafeString, mark_safe
+
+from slippers.streaming import stream_rendered
+
+
+async def join_pieces(pieces: List[Any]) -> SafeString:
+    """Await the deferred parts of a rendered template concurrently, and join them with the rest of the output"""
+    pending = [piece for piece in pieces if inspect.isawaitable(piece)]
+    if not pending:
+        return mark_safe("".join(pieces))
+
+    results = iter(await asyncio.gather(*pending))
+
+    return mark_safe("".join(next(results) if inspect.isawaitable(piece) else piece for piece in pieces))
+
+
+def render_pieces(template: Union[str, Template], context: Optional[Dict], request, using: Optional[str]) -> List[Any]:
+    if isinstance(template, str):
+        template = get_template(template, using=using)
+
+    # Unwrap templates returned by template backends
+    template = getattr(template, "template", template)
+
+    context = make_context(context, request, autoescape=template.engine.autoescape)
+
+    return list(stream_rendered(template, context, "stream_async"))
+
+
+async def arender_template(
+    template: Union[str, Template],
+    context: Optional[Dict] = None,
+    request=None,
+    using: Optional[str] = None,
+) -> SafeString:
+    """Render a template, or the name of one, from async code, awaiting component front matter concurrently"""
+    pieces = await sync_to_async(render_pieces)(template, context, request, using)
+
+    return await join_pieces(pieces)
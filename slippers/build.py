@@ -0,0 +1,116 @@
+"""
+Ahead-of-time compilation of registered components.
+
+Component templates and their front matter are compiled and validated by the `slippers_compile` management command.
+The compiled front matter is written to a build file that is loaded when the app is ready, so workers don't have to
+compile it on first use.
+"""
+
+import marshal
+import sys
+from dataclasses import dataclass, field
+from types import CodeType
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from django.template import Engine, TemplateDoesNotExist, TemplateSyntaxError
+
+from slippers.components import ComponentTemplate, get_component_template
+from slippers.props import Props, compile_front_matter, front_matter_awaits, get_prop_validator, preload_front_matter
+from slippers.templatetags.slippers import parse_component_definition
+
+
+@dataclass
+class Build:
+    # Compiled front matter and its source, keyed by template origin
+    front_matter: Dict[str, Tuple[str, CodeType]] = field(default_factory=dict)
+    templates: int = 0
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
+
+def check_front_matter(name: str, component: ComponentTemplate, origin: str) -> Tuple[List[str], List[str]]:
+    """
+    Run a component's front matter without props and check its defaults against its types. The prop validator is
+    cached under the key rendering looks it up with.
+    """
+    errors: List[str] = []
+
+    # Front matter that awaits is usually loading data, so it isn't run at build time
+    if front_matter_awaits(component.front_matter, origin):
+        return errors, []
+
+    try:
+        props = Props.from_string({}, component.front_matter, origin)
+        validator = get_prop_validator(props.types, props.defaults, key=(origin, component.fingerprint))
+    except Exception as e:
+        # Front matter can depend on props being passed in, so this doesn't fail the build
+        return errors, [f"{name}: front matter could not be evaluated without props ({e!r})"]
+
+    for prop_name, value in props.defaults.items():
+        error = validator.check_prop(prop_name, value)
+        if error is not None and error.error == "invalid":
+            errors.append(f"{name}: default for prop '{prop_name}' doesn't match its type")
+
+    return errors, []
+
+
+def compile_components(components: Dict[str, Union[str, Dict[str, Any]]], engine: Engine) -> Build:
+    """Compile and validate the templates and front matter of the given components"""
+    build = Build()
+
+    for name, definition in components.items():
+        template_path, _ = parse_component_definition(definition)
+
+        try:
+            template = engine.get_template(template_path)
+        except TemplateDoesNotExist:
+            build.errors.append(f"{name}: template '{template_path}' does not exist")
+            continue
+        except TemplateSyntaxError as e:
+            build.errors.append(f"{name}: {e}")
+            continue
+
+        component = get_component_template(template)
+        build.templates += 1
+
+        if not component.front_matter:
+            continue
+
+        origin = template.origin.name
+
+        try:
+            code = compile_front_matter(component.front_matter, origin)
+        except SyntaxError as e:
+            build.errors.append(f"{name}: invalid front matter on line {e.lineno} ({e.msg})")
+            continue
+
+        build.front_matter[origin] = (component.front_matter, code)
+
+        errors, warnings = check_front_matter(name, component, origin)
+        build.errors.extend(errors)
+        build.warnings.extend(warnings)
+
+    return build
+
+
+def write_build(path: str, build: Build) -> None:
+    with open(path, "wb") as f:
+        marshal.dump({"cache_tag": sys.implementation.cache_tag, "front_matter": build.front_matter}, f)
+
+
+def load_build(path: str) -> Optional[int]:
+    """
+    Load compiled front matter from a build file, returning the number of components loaded, or None if the file was
+    compiled by another version of Python
+    """
+    with open(path, "rb") as f:
+        data = marshal.load(f)
+
+    # Code objects can only be used by the Python version that compiled them
+    if data.get("cache_tag") != sys.implementation.cache_tag:
+        return None
+
+    for origin, (source, code) in data["front_matter"].items():
+        preload_front_matter(origin, source, code)
+
+    return len(data["front_matter"])
@@ -0,0 +1,140 @@
+"""
+Caching for the rendered output of pure components.
+
+A pure component's output depends only on its props and children, so it can be cached under a key derived from them.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from django.conf import settings as django_settings
+from django.core.cache import caches
+from django.utils import translation
+from django.utils.safestring import SafeString
+
+from slippers.conf import settings
+
+# Values that can be part of a cache key. Exact types are used so that subclasses with custom behaviour, and the
+# difference between safe and unsafe strings, aren't lost.
+KEY_TYPES = (str, SafeString, int, float, bool, type(None))
+
+
+def freeze(value: Any) -> Any:
+    """Convert a prop value into a hashable representation, raising TypeError if it can't be part of a cache key"""
+    value_type = type(value)
+
+    if value_type in KEY_TYPES:
+        return (value_type.__name__, value)
+
+    if value_type in (list, tuple):
+        return (value_type.__name__, tuple(freeze(item) for item in value))
+
+    if value_type is dict:
+        return ("dict", tuple((freeze(key), freeze(item)) for key, item in value.items()))
+
+    raise TypeError(f"{value_type.__name__} values can't be part of a component cache key")
+
+
+def make_cache_key(
+    template_path: str, fingerprint: str, attributes: Dict[str, Any], children: Any, autoescape: bool
+) -> Optional[str]:
+    """Return the cache key for a component's output, or None if its props can't be cached"""
+    try:
+        frozen = freeze(attributes)
+    except TypeError:
+        return None
+
+    language = translation.get_language() if django_settings.USE_I18N else None
+    digest = hashlib.sha1(repr((frozen, children, autoescape, language)).encode()).hexdigest()
+
+    return f"slippers:{template_path}:{fingerprint}:{digest}"
+
+
+class ComponentCache:
+    """In-process LRU cache of component output"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "size": len(self._entries)}
+
+
+class DjangoComponentCache(ComponentCache):
+    """Component output stored in one of Django's caches. Evictions are handled, and not reported, by the backend."""
+
+    def __init__(self, alias: str):
+        super().__init__(max_size=0)
+        self.alias = alias
+
+    def get(self, key: str) -> Optional[str]:
+        value = caches[self.alias].get(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        caches[self.alias].set(key, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+
+_component_cache: Optional[ComponentCache] = None
+
+
+def get_component_cache() -> ComponentCache:
+    """Return the cache for pure component output, as configured by SLIPPERS_COMPONENT_CACHE"""
+    global _component_cache
+
+    if _component_cache is None:
+        alias = settings.SLIPPERS_COMPONENT_CACHE
+        if alias is None:
+            _component_cache = ComponentCache(max_size=settings.SLIPPERS_COMPONENT_CACHE_SIZE)
+        else:
+            _component_cache = DjangoComponentCache(alias)
+
+    return _component_cache
+
+
+def reset_component_cache() -> None:
+    """Discard the component cache, so it's recreated from the current settings"""
+    global _component_cache
+    _component_cache = None
@@ -0,0 +1,181 @@
+"""
+Compiled state for component templates.
+
+A component template is split into its front matter and body once, and the result is stored on the Django Template
+object so rendering a component never has to look at its source again.
+"""
+
+import hashlib
+import re
+from collections import defaultdict
+from copy import copy
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Set, Tuple
+
+from django.template import Template, engines
+from django.template.autoreload import get_template_directories
+from django.template.backends.django import DjangoTemplates
+from django.template.base import UNKNOWN_SOURCE, NodeList, Origin, TextNode
+
+front_matter_delimiter_re = re.compile(r"^---\s*$", re.MULTILINE)
+
+# Incremented whenever component templates may have changed, invalidating templates memoized by component nodes
+generation = 0
+
+
+def reset_component_templates() -> None:
+    """Make component nodes look up their templates again on their next render"""
+    global generation
+    generation += 1
+
+
+# Files of the templates that use each component tag, recorded as the templates are parsed
+tag_dependents: Dict[str, Set[str]] = defaultdict(set)
+
+
+def record_component_use(tag_name: str, origin: Origin) -> None:
+    """Remember that the template loaded from `origin` uses a component tag"""
+    if origin is not None and origin.name != UNKNOWN_SOURCE:
+        tag_dependents[tag_name.lstrip("#")].add(origin.name)
+
+
+def get_cached_loaders() -> Iterator:
+    """Yield the cached loaders of every Django template engine, including the form renderer's"""
+    from django.forms.renderers import get_default_renderer
+
+    backends = [*engines.all(), getattr(get_default_renderer(), "engine", None)]
+
+    for backend in backends:
+        if not isinstance(backend, DjangoTemplates):
+            continue
+
+        for loader in backend.engine.template_loaders:
+            if hasattr(loader, "get_template_cache"):
+                yield loader
+
+
+def evict_templates(file_names: Iterable[str]) -> int:
+    """
+    Remove the templates loaded from the given files from the cached loaders, so only they are parsed again.
+
+    Templates cached as missing are removed too, as one of the files may have just been created.
+    """
+    file_names = set(file_names)
+    evicted = 0
+
+    for loader in get_cached_loaders():
+        cache = loader.get_template_cache
+        for key, cached in list(cache.items()):
+            if not isinstance(cached, Template):
+                del cache[key]
+            elif cached.origin.name in file_names:
+                del cache[key]
+                evicted += 1
+
+    reset_component_templates()
+
+    return evicted
+
+
+def evict_tag_dependents(tag_names: Iterable[str]) -> int:
+    """Remove the templates that use any of the given component tags from the cached loaders"""
+    return evict_templates(name for tag_name in tag_names for name in tag_dependents.get(tag_name, ()))
+
+
+def reload_template(file_path: Path) -> bool:
+    """Forget what was compiled from a changed file if it's a template. Returns whether it was."""
+    if not any(template_dir in file_path.parents for template_dir in get_template_directories()):
+        return False
+
+    evict_templates([str(file_path)])
+
+    return True
+
+
+def split_front_matter(code: str) -> Tuple[str, int]:
+    """Return a component's front matter and the offset at which its template section starts"""
+
+    # Components that have front matter must start with `---`
+    if not code.strip().startswith("---"):
+        return "", 0
+
+    delimiters = front_matter_delimiter_re.finditer(code)
+    opening = next(delimiters, None)
+    closing = next(delimiters, None)
+
+    # Any case other than an opening and a closing delimiter is rendered as is
+    if opening is None or closing is None:
+        return "", 0
+
+    return code[opening.end() : closing.start()].strip(), closing.end()
+
+
+def extract_template_parts(code: str) -> Tuple[str, str]:
+    """Extract the front matter and template sections from a component's code"""
+
+    front_matter, offset = split_front_matter(code)
+
+    return front_matter, code[offset:]  # Don't strip template
+
+
+def compile_body(template: Template, offset: int) -> Template:
+    """Return a Template that renders only the section of `template` that starts at `offset`"""
+
+    if not offset:
+        return template
+
+    nodelist = template.nodelist
+    first = nodelist[0] if nodelist else None
+
+    # Front matter is plain text, so it usually sits at the start of the first TextNode. Dropping it from the already
+    # compiled nodelist avoids parsing the template twice and keeps line numbers in error messages intact.
+    if not isinstance(first, TextNode) or len(first.s) < offset:
+        return Template(template.source[offset:], template.origin, template.name, template.engine)
+
+    body_nodelist = NodeList()
+    body_nodelist.contains_nontext = nodelist.contains_nontext
+
+    if first.s[offset:]:
+        remainder = TextNode(first.s[offset:])
+        remainder.token = first.token
+        remainder.origin = first.origin
+        body_nodelist.append(remainder)
+
+    body_nodelist.extend(nodelist[1:])
+
+    body = copy(template)
+    body.nodelist = body_nodelist
+
+    return body
+
+
+@dataclass
+class ComponentTemplate:
+    """A component template split into its front matter and template body"""
+
+    front_matter: str
+    body: Template
+    source: str
+
+    @classmethod
+    def from_template(cls, template: Template) -> "ComponentTemplate":
+        front_matter, offset = split_front_matter(template.source)
+        return cls(front_matter=front_matter, body=compile_body(template, offset), source=template.source)
+
+    @cached_property
+    def fingerprint(self) -> str:
+        """Hash of the component's source, used to tell apart output rendered by different versions of it"""
+        return hashlib.sha1(self.source.encode()).hexdigest()
+
+
+def get_component_template(template: Template) -> ComponentTemplate:
+    """Return the compiled component stored on a Template, splitting it on first use"""
+
+    component = getattr(template, "slippers_component", None)
+
+    if component is None:
+        component = template.slippers_component = ComponentTemplate.from_template(template)
+
+    return component
@@ -1,4 +1,4 @@
-from typing import List, Literal
+from typing import List, Literal, Optional
 
 from django.conf import settings as django_settings
 
@@ -20,5 +20,55 @@ class Settings:
             ["console", "overlay"],
         )
 
+    @property
+    def SLIPPERS_TYPE_CHECKING_SAMPLE_RATE(self) -> float:
+        """Fraction of renders to type check when runtime type checking is off. Errors are logged."""
+        return getattr(django_settings, "SLIPPERS_TYPE_CHECKING_SAMPLE_RATE", 0.0)
+
+    @property
+    def SLIPPERS_TYPE_CHECKING_WARMUP_RENDERS(self) -> int:
+        """Number of renders per call site to type check when runtime type checking is off. Errors are logged."""
+        return getattr(django_settings, "SLIPPERS_TYPE_CHECKING_WARMUP_RENDERS", 0)
+
+    @property
+    def SLIPPERS_COMPONENT_CACHE(self) -> Optional[str]:
+        """Alias of the Django cache to store pure component output in. None uses an in-process LRU cache."""
+        return getattr(django_settings, "SLIPPERS_COMPONENT_CACHE", None)
+
+    @property
+    def SLIPPERS_COMPONENT_CACHE_SIZE(self) -> int:
+        """Maximum number of entries kept by the in-process component cache"""
+        return getattr(django_settings, "SLIPPERS_COMPONENT_CACHE_SIZE", 1024)
+
+    @property
+    def SLIPPERS_COMPILED_COMPONENTS(self) -> Optional[str]:
+        """Path of the build file written by `manage.py slippers_compile`, loaded when the app is ready"""
+        return getattr(django_settings, "SLIPPERS_COMPILED_COMPONENTS", None)
+
+    @property
+    def SLIPPERS_WARMUP(self) -> bool:
+        """Load and compile all registered components when the app is ready"""
+        return getattr(django_settings, "SLIPPERS_WARMUP", False)
+
+    @property
+    def SLIPPERS_WARMUP_FREEZE_GC(self) -> bool:
+        """Call gc.freeze() after warming up, so forked workers share the compiled components copy-on-write"""
+        return getattr(django_settings, "SLIPPERS_WARMUP_FREEZE_GC", False)
+
+    @property
+    def SLIPPERS_FINE_GRAINED_RELOAD(self) -> bool:
+        """Only parse the changed templates again when a template file changes, instead of every template"""
+        return getattr(django_settings, "SLIPPERS_FINE_GRAINED_RELOAD", False)
+
+    @property
+    def SLIPPERS_METRICS(self) -> List[str]:
+        """Dotted paths of the sinks that component render metrics are sent to. Metrics are off when empty."""
+        return getattr(django_settings, "SLIPPERS_METRICS", [])
+
+    @property
+    def SLIPPERS_HOIST_STATIC_COMPONENTS(self) -> bool:
+        """Render component call sites with only literal attributes and static children once, and reuse the output"""
+        return getattr(django_settings, "SLIPPERS_HOIST_STATIC_COMPONENTS", False)
+
 
 settings = Settings()
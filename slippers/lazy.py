@@ -0,0 +1,97 @@
+"""
+Template output that's only rendered if it's used.
+"""
+
+from copy import copy
+from typing import Any, Dict
+
+from django.utils.safestring import SafeData, SafeString
+
+
+class LazyRender(SafeData):
+    """
+    The output of a nodelist, rendered in the given context the first time it's used and at most once.
+
+    Outputting, escaping, testing, measuring, comparing, indexing, or iterating over it, or calling string methods on
+    it, renders it, so templates can use it like the SafeString it renders to. It's SafeData too, so filters that
+    keep their input safe keep it safe.
+    """
+
+    __slots__ = ("nodelist", "context", "output")
+
+    def __init__(self, nodelist, context):
+        self.nodelist = nodelist
+        self.context = context
+        self.output = None
+
+    def render(self) -> SafeString:
+        if self.output is None:
+            self.output = self.nodelist.render(self.context)
+            # Release the context once it's no longer needed
+            self.nodelist = self.context = None
+
+        return self.output
+
+    def __str__(self):
+        return self.render()
+
+    def __html__(self):
+        return self.render()
+
+    def __bool__(self):
+        return bool(self.render())
+
+    def __len__(self):
+        return len(self.render())
+
+    def __eq__(self, other):
+        return self.render() == other
+
+    def __hash__(self):
+        return hash(self.render())
+
+    def __getattr__(self, name):
+        # Private names are left alone, so copying or pickling doesn't render, or recurse before the slots are set
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.render(), name)
+
+    def __getitem__(self, key):
+        return self.render()[key]
+
+    def __iter__(self):
+        return iter(self.render())
+
+    def __contains__(self, item):
+        return item in self.render()
+
+    def __add__(self, other):
+        return self.render() + other
+
+    def __radd__(self, other):
+        return other + self.render()
+
+    def __repr__(self):
+        state = "unrendered" if self.output is None else repr(self.output)
+        return f"<{type(self).__name__} {state}>"
+
+
+def force_lazy(values: Dict[str, Any]) -> Dict[str, Any]:
+    """Render the lazy values in a mapping, for code that expects strings"""
+    for value in values.values():
+        if isinstance(value, LazyRender):
+            break
+    else:
+        return values
+
+    return {key: value.render() if isinstance(value, LazyRender) else value for key, value in values.items()}
+
+
+def snapshot_context(context):
+    """
+    Copy a context along with the dicts in it, so a lazy render sees the variables as they were when it was created,
+    however the context changes later. The values themselves aren't copied.
+    """
+    snapshot = copy(context)
+    snapshot.dicts = [dict(values) for values in context.dicts]
+    return snapshot
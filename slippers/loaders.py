@@ -0,0 +1,15 @@
+from django.template.loaders import cached
+
+from slippers.components import get_component_template
+
+
+class Loader(cached.Loader):
+    """
+    Cached template loader that splits component front matter from the template body when a template is first loaded,
+    rather than when a component is first rendered.
+    """
+
+    def get_template(self, template_name, skip=None):
+        template = super().get_template(template_name, skip)
+        get_component_template(template)
+        return template
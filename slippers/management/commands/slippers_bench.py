@@ -0,0 +1,191 @@
+import json
+import math
+import os
+import time
+import tracemalloc
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+import yaml
+from django.core.management.base import BaseCommand, CommandError
+from django.template.loader import get_template
+
+from slippers.templatetags.slippers import component_registry, render_component
+from slippers.tracing import trace
+
+
+def load_context(path: Optional[str]) -> Dict:
+    """Load a template context or component props from a JSON or YAML file"""
+    if not path:
+        return {}
+
+    with open(path) as f:
+        context = yaml.safe_load(f) if path.endswith((".yaml", ".yml")) else json.load(f)
+
+    if not isinstance(context, dict):
+        raise CommandError(f"{path} must contain a mapping of names to values")
+
+    return context
+
+
+def make_renderer(template_name: Optional[str], component: Optional[str], context: Dict) -> Callable[[], str]:
+    if component:
+        props = dict(context)
+        children = props.pop("children", None)
+        return lambda: render_component(component, children, **props)
+
+    template = get_template(template_name)
+    return lambda: template.render(context)
+
+
+def time_renders(template_name: Optional[str], component: Optional[str], context: Dict, count: int) -> List[float]:
+    """Render `count` times after a warm-up render, and return the time of each render in seconds"""
+    render = make_renderer(template_name, component, context)
+    render()
+
+    latencies = []
+    for _ in range(count):
+        start = time.perf_counter()
+        render()
+        latencies.append(time.perf_counter() - start)
+
+    return latencies
+
+
+def setup_worker(settings_module: str) -> None:
+    """Set up Django in worker processes that don't inherit it from the parent"""
+    import django
+    from django.apps import apps
+
+    if not apps.ready:
+        os.environ.setdefault("DJANGO_SETTINGS_MODULE", settings_module)
+        django.setup()
+
+
+def percentile(values: List[float], percent: float) -> float:
+    """Nearest-rank percentile of sorted values"""
+    return values[max(0, math.ceil(percent / 100 * len(values)) - 1)]
+
+
+class Command(BaseCommand):
+    help = "Render a template or a registered component repeatedly and report how long it takes"
+
+    def add_arguments(self, parser):
+        parser.add_argument("template", nargs="?", help="Name of the template to render")
+        parser.add_argument("--component", help="Name of a registered component to render instead of a template")
+        parser.add_argument(
+            "--context",
+            help="JSON or YAML file with the template context, or the component props. "
+            "For components, a `children` key is passed as children.",
+        )
+        parser.add_argument("-n", "--iterations", type=int, default=100, help="Number of renders to time")
+
+        concurrency = parser.add_mutually_exclusive_group()
+        concurrency.add_argument("--threads", type=int, default=0, help="Render from this many threads")
+        concurrency.add_argument("--processes", type=int, default=0, help="Render from this many processes")
+
+        parser.add_argument("--output", help="Also write the results to this JSON file")
+
+    def handle(self, *args, **options):
+        template_name, component = options["template"], options["component"]
+        iterations = options["iterations"]
+
+        if bool(template_name) == bool(component):
+            raise CommandError("Pass either a template name or --component.")
+        if component and component not in component_registry:
+            raise CommandError(f"No component named '{component}' has been registered.")
+        if iterations < 1:
+            raise CommandError("--iterations must be at least 1.")
+
+        context = load_context(options["context"])
+        target = (template_name, component, context)
+        workers = options["threads"] or options["processes"]
+
+        start = time.perf_counter()
+        latencies = self.time_renders(target, iterations, options)
+        elapsed = time.perf_counter() - start
+
+        latencies.sort()
+        results = {
+            "target": component or template_name,
+            "iterations": iterations,
+            "threads": options["threads"],
+            "processes": options["processes"],
+            "seconds": elapsed,
+            "throughput": iterations / elapsed,
+            "p50": percentile(latencies, 50),
+            "p95": percentile(latencies, 95),
+            "p99": percentile(latencies, 99),
+            "peak_memory": self.measure_memory(target),
+            "components": self.measure_components(target, iterations),
+        }
+
+        concurrency = ""
+        if workers:
+            concurrency = f" with {workers} {'threads' if options['threads'] else 'processes'}"
+
+        self.stdout.write(f"Rendered {results['target']} {iterations:,} times in {elapsed:.2f}s{concurrency}")
+        self.stdout.write(f"Throughput: {results['throughput']:,.1f} renders/s")
+        self.stdout.write("Latency: " + "  ".join(f"{p} {results[p] * 1000:.2f}ms" for p in ("p50", "p95", "p99")))
+        self.stdout.write(f"Peak memory per render: {results['peak_memory'] / 1024:,.1f} KiB")
+
+        if results["components"]:
+            self.stdout.write("\nTime spent in each component, excluding nested components:")
+            for name, share in sorted(results["components"].items(), key=lambda item: -item[1]):
+                self.stdout.write(f"  {name:32} {share:6.1%}")
+
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                json.dump(results, f, indent=2)
+
+    def time_renders(self, target, iterations: int, options) -> List[float]:
+        """Time each render, spreading them over worker threads or processes if asked to"""
+        if options["threads"]:
+            executor = ThreadPoolExecutor(options["threads"])
+            workers = options["threads"]
+        elif options["processes"]:
+            executor = ProcessPoolExecutor(
+                options["processes"],
+                initializer=setup_worker,
+                initargs=(os.environ.get("DJANGO_SETTINGS_MODULE"),),
+            )
+            workers = options["processes"]
+        else:
+            return time_renders(*target, iterations)
+
+        counts = [iterations // workers + (1 if i < iterations % workers else 0) for i in range(workers)]
+
+        with executor:
+            batches = executor.map(time_renders, *zip(*[(*target, count) for count in counts if count]))
+            return [latency for batch in batches for latency in batch]
+
+    def measure_memory(self, target) -> int:
+        """Return the peak memory allocated by a single render, in bytes"""
+        render = make_renderer(*target)
+        render()
+
+        tracemalloc.start()
+        try:
+            render()
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    def measure_components(self, target, iterations: int) -> Dict[str, float]:
+        """Return the share of render time spent in each component, excluding the components nested in it"""
+        render = make_renderer(*target)
+        render()
+
+        self_times = defaultdict(float)
+        start = time.perf_counter()
+        with trace() as tracer:
+            for _ in range(iterations):
+                render()
+        elapsed = time.perf_counter() - start
+
+        for root in tracer.roots:
+            for span in root.walk():
+                self_times[span.name] += span.duration - sum(child.duration for child in span.children)
+
+        return {name: self_time / elapsed for name, self_time in self_times.items()}
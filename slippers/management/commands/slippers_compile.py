@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.template import Engine, TemplateDoesNotExist
+
+from slippers.apps import get_components
+from slippers.build import compile_components, write_build
+from slippers.conf import settings
+
+
+class Command(BaseCommand):
+    help = "Compile and validate all components registered in components.yaml"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            help="Where to write the build file. Defaults to SLIPPERS_COMPILED_COMPONENTS.",
+        )
+
+    def handle(self, *args, **options):
+        output = options["output"] or settings.SLIPPERS_COMPILED_COMPONENTS
+
+        try:
+            components = get_components()
+        except TemplateDoesNotExist:
+            raise CommandError("No components.yaml found in any template directory.") from None
+
+        build = compile_components(components, Engine.get_default())
+
+        for warning in build.warnings:
+            self.stderr.write(self.style.WARNING(warning))
+
+        if build.errors:
+            raise CommandError("Components failed to compile:\n" + "\n".join(build.errors))
+
+        if output:
+            write_build(output, build)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Compiled {build.templates} component templates and {len(build.front_matter)} front matter blocks"
+                + (f" to {output}" if output else "")
+            )
+        )
@@ -0,0 +1,148 @@
+"""
+Per-component render metrics.
+
+When `SLIPPERS_METRICS` lists one or more sinks, each component render is timed and passed to them as a
+`ComponentRender`. With no sinks configured, component nodes skip timing altogether.
+"""
+
+import threading
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Callable, Dict, List, Optional
+
+from django.dispatch import Signal
+from django.utils.module_loading import import_string
+
+from slippers.conf import settings
+
+# The phases a component render is split into
+PHASES = ("resolve", "check", "render", "post")
+
+# Sent for every component render by the `send_signal` sink, with a `render` argument
+component_rendered = Signal()
+
+
+@dataclass
+class ComponentRender:
+    """Timings, in seconds, and output size of a single component render"""
+
+    tag_name: str
+    template_path: str
+    origin_template_name: Optional[str]
+    origin_lineno: Optional[int]
+    timings: Dict[str, float]
+    size: int
+
+    @property
+    def total(self) -> float:
+        return sum(self.timings.values())
+
+
+@dataclass
+class RenderTimer:
+    """Splits the wall time of a component render into phases"""
+
+    last: float = field(default_factory=perf_counter)
+    timings: Dict[str, float] = field(default_factory=dict)
+
+    def lap(self, phase: str) -> None:
+        """Add the time since the previous lap to `phase`"""
+        now = perf_counter()
+        self.timings[phase] = self.timings.get(phase, 0.0) + now - self.last
+        self.last = now
+
+
+_sinks: Optional[List[Callable[[ComponentRender], None]]] = None
+
+
+def get_sinks() -> List[Callable[[ComponentRender], None]]:
+    """Return the sinks listed in `SLIPPERS_METRICS`, importing them on first use"""
+    global _sinks
+    if _sinks is None:
+        _sinks = [import_string(path) for path in settings.SLIPPERS_METRICS]
+    return _sinks
+
+
+def reset_sinks() -> None:
+    global _sinks
+    _sinks = None
+
+
+def start_timer() -> Optional[RenderTimer]:
+    """Return a timer for a component render, or None if metrics are off"""
+    return RenderTimer() if get_sinks() else None
+
+
+def record(node, timer: RenderTimer, output: str) -> None:
+    """Pass a timed component render on to every sink"""
+    timer.lap("post")
+
+    render = ComponentRender(
+        tag_name=node.tag_name.lstrip("#"),
+        template_path=node.template_path,
+        origin_template_name=node.origin_template_name,
+        origin_lineno=node.origin_lineno,
+        timings=timer.timings,
+        size=len(output),
+    )
+
+    for sink in get_sinks():
+        sink(render)
+
+
+def send_signal(render: ComponentRender) -> None:
+    """Sink that sends the `component_rendered` signal"""
+    component_rendered.send(sender=ComponentRender, render=render)
+
+
+class MetricsAggregator:
+    """Sink that keeps totals per component tag in memory"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    def __call__(self, render: ComponentRender) -> None:
+        with self._lock:
+            stats = self._stats.get(render.tag_name)
+            if stats is None:
+                stats = self._stats[render.tag_name] = dict.fromkeys(("count", "size", "total", *PHASES), 0)
+
+            stats["count"] += 1
+            stats["size"] += render.size
+            stats["total"] += render.total
+            for phase, seconds in render.timings.items():
+                stats[phase] += seconds
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Return a copy of the totals, by tag name"""
+        with self._lock:
+            return {tag_name: dict(stats) for tag_name, stats in self._stats.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+# Default in-memory sink, enabled with `"slippers.metrics.aggregator"`
+aggregator = MetricsAggregator()
+
+
+class StatsdSink:
+    """
+    Sink that reports to a statsd client, or anything with the same `incr` and `timing` methods.
+
+    Instantiate it in your project with your client, and add its dotted path to `SLIPPERS_METRICS`.
+    """
+
+    def __init__(self, client, prefix: str = "slippers"):
+        self.client = client
+        self.prefix = prefix
+
+    def __call__(self, render: ComponentRender) -> None:
+        name = f"{self.prefix}.{render.tag_name}"
+
+        self.client.incr(f"{name}.count")
+        self.client.incr(f"{name}.size", render.size)
+        for phase, seconds in render.timings.items():
+            self.client.timing(f"{name}.{phase}", seconds * 1000)
@@ -1,12 +1,60 @@
+import ast
+import inspect
 import json
+import logging
+import typing
 from collections.abc import Mapping
 from dataclasses import dataclass
-from typing import Any, Dict, List, Literal, Optional, Union, get_args, get_origin
+from enum import Enum
+from types import CodeType
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Literal, Optional, Tuple, Union, get_args, get_origin
 
+from asgiref.sync import async_to_sync
 from django.utils.html import SafeString
 from django.utils.safestring import mark_safe
 from typeguard import check_type, get_type_name
 
+logger = logging.getLogger("slippers")
+
+NoneType = type(None)
+
+# Names made available to front matter, equivalent to `from typing import *`
+TYPING_NAMESPACE = {name: getattr(typing, name) for name in typing.__all__}
+
+# Compiled front matter code objects, keyed by template origin. The source is stored alongside the code object so an
+# edited component is recompiled instead of serving stale code.
+_front_matter_cache: Dict[str, Tuple[str, CodeType]] = {}
+
+
+def compile_front_matter(code: str, origin: Optional[str] = None) -> CodeType:
+    """Compile a component's front matter, reusing the cached code object if its source hasn't changed"""
+
+    key = code if origin is None else origin
+
+    cached = _front_matter_cache.get(key)
+    if cached is not None and cached[0] == code:
+        return cached[1]
+
+    # Front matter may `await` at the top level, which compiles it into a coroutine
+    compiled = compile(code, origin or "<front matter>", "exec", flags=ast.PyCF_ALLOW_TOP_LEVEL_AWAIT)
+    _front_matter_cache[key] = (code, compiled)
+
+    return compiled
+
+
+def front_matter_awaits(code: str, origin: Optional[str] = None) -> bool:
+    """Whether a component's front matter uses `await`, and so has to be run in an event loop"""
+    return bool(compile_front_matter(code, origin).co_flags & inspect.CO_COROUTINE)
+
+
+async def await_front_matter(pending) -> None:
+    await pending
+
+
+def preload_front_matter(origin: str, code: str, compiled: CodeType) -> None:
+    """Add front matter compiled ahead of time to the cache"""
+    _front_matter_cache[origin] = (code, compiled)
+
 
 class Props(Mapping):
     """Props object used in component code"""
@@ -40,15 +88,39 @@ class Props(Mapping):
         return len({**self._attributes, **self.defaults})
 
     @classmethod
-    def from_string(cls, attributes: Dict[str, Any], code: str) -> "Props":
-        """Parse a component's code section to extract PropTypes and defaults"""
+    def execute(cls, attributes: Dict[str, Any], code: str, origin: Optional[str] = None) -> Tuple["Props", Any]:
+        """
+        Execute a component's code section. Returns the props, and a coroutine that has to be awaited to finish
+        executing it if it uses `await`, or None.
+        """
 
         props = cls(attributes, {}, {})
 
-        code_locals = {"props": props}
+        code_locals = {**TYPING_NAMESPACE, "props": props}
 
         # Execute the source code in a local scope
-        exec(f"from typing import *\n{code}", {}, code_locals)
+        return props, eval(compile_front_matter(code, origin), {}, code_locals)
+
+    @classmethod
+    def from_string(cls, attributes: Dict[str, Any], code: str, origin: Optional[str] = None) -> "Props":
+        """Parse a component's code section to extract PropTypes and defaults"""
+
+        props, pending = cls.execute(attributes, code, origin)
+
+        # Front matter that awaits is run to completion in an event loop
+        if pending is not None:
+            async_to_sync(await_front_matter)(pending)
+
+        return props
+
+    @classmethod
+    async def afrom_string(cls, attributes: Dict[str, Any], code: str, origin: Optional[str] = None) -> "Props":
+        """Like `from_string`, awaiting front matter that uses `await`"""
+
+        props, pending = cls.execute(attributes, code, origin)
+
+        if pending is not None:
+            await pending
 
         return props
 
@@ -61,65 +133,174 @@ class PropError:
     actual: Optional[type]
 
 
+def compile_type_check(expected: Any) -> Callable[[Any], bool]:  # noqa: C901
+    """Compile a prop type into a function that returns whether a value matches it"""
+
+    if expected is Any:
+        return lambda value: True
+
+    if expected in (str, int, bool, list, dict, NoneType):
+        return lambda value: isinstance(value, expected)
+
+    if expected is float:
+        return lambda value: isinstance(value, (float, int))
+
+    origin = get_origin(expected)
+    args = get_args(expected)
+
+    if origin is Union:
+        checks = tuple(compile_type_check(arg) for arg in args)
+        return lambda value: any(check(value) for check in checks)
+
+    if origin is list and len(args) == 1:
+        if args[0] is Any:
+            return lambda value: isinstance(value, list)
+
+        check_item = compile_type_check(args[0])
+        return lambda value: isinstance(value, list) and all(check_item(item) for item in value)
+
+    if origin is dict and len(args) == 2:
+        if args == (Any, Any):
+            return lambda value: isinstance(value, dict)
+
+        check_key = compile_type_check(args[0])
+        check_value = compile_type_check(args[1])
+        return lambda value: (
+            isinstance(value, dict) and all(check_key(key) and check_value(item) for key, item in value.items())
+        )
+
+    if origin is Literal and all(isinstance(arg, (int, str, bytes, bool, NoneType, Enum)) for arg in args):
+        return lambda value: value in args
+
+    # Anything else is left to typeguard
+    def check(value: Any) -> bool:
+        try:
+            check_type("prop", value, expected)
+        except TypeError:
+            return False
+        return True
+
+    return check
+
+
+class PropValidator:
+    """Prop types compiled into checks, with the required props worked out ahead of time"""
+
+    def __init__(self, types: Dict[str, type], defaults: Iterable[str]):
+        self.types = types
+        self.defaults = frozenset(defaults)
+        self.checks = {name: compile_type_check(expected) for name, expected in types.items()}
+        self.required = tuple(
+            name
+            for name, expected in types.items()
+            # Props with Optional types or defaults are not required
+            if not (get_origin(expected) is Union and NoneType in get_args(expected)) and name not in defaults
+        )
+
+    def matches(self, types: Dict[str, type], defaults: Iterable[str]) -> bool:
+        """Whether this validator checks the given prop types. Types are compared by identity before equality."""
+        return (
+            self.types.keys() == types.keys()
+            and all(self.types[name] is expected or self.types[name] == expected for name, expected in types.items())
+            and self.defaults == frozenset(defaults)
+        )
+
+    def check_prop(self, name: str, value: Any) -> Optional[PropError]:
+        """Return the error for a single prop, if any"""
+        check = self.checks.get(name)
+
+        if check is None:
+            return PropError(error="extra", name=name, expected=None, actual=type(value))
+
+        if not check(value):
+            return PropError(error="invalid", name=name, expected=self.types[name], actual=type(value))
+
+        return None
+
+    def __call__(self, attributes: Dict[str, Any], constants: Optional["ConstantProps"] = None) -> List[PropError]:
+        # Check for missing props
+        errors = [
+            PropError(error="missing", name=name, expected=self.types[name], actual=None)
+            for name in self.required
+            if name not in attributes
+        ]
+        extra = []
+
+        constant_errors = constants.check(self) if constants is not None else {}
+
+        # Check for invalid and extra props
+        for name, actual in attributes.items():
+            if name in constant_errors:
+                error = constant_errors[name]
+            else:
+                error = self.check_prop(name, actual)
+
+            if error is None:
+                continue
+            elif error.error == "extra":
+                extra.append(error)
+            else:
+                errors.append(error)
+
+        return errors + extra
+
+
+class ConstantProps:
+    """Props set to constant values at a component call site, checked once for each set of prop types"""
+
+    def __init__(self, values: Dict[str, Any]):
+        self.values = values
+        self._errors: Optional[Tuple[PropValidator, Dict[str, Optional[PropError]]]] = None
+
+    def check(self, validator: PropValidator) -> Dict[str, Optional[PropError]]:
+        errors = self._errors
+
+        if errors is None or errors[0] is not validator:
+            errors = self._errors = (
+                validator,
+                {name: validator.check_prop(name, value) for name, value in self.values.items()},
+            )
+
+        return errors[1]
+
+
+# Compiled validators, keyed by component, or by the identity of each prop type when no component key is given.
+# Hashing typing generics is slower than checking most props, and a cached validator holds on to its types so their
+# ids can't be reused while it's in the cache. `typing` only caches a limited number of parameterized generics, so
+# front matter can evaluate to new but equal type objects on a later render, which a component key still finds.
+_prop_validators: Dict[Hashable, PropValidator] = {}
+MAX_CACHED_PROP_VALIDATORS = 1024
+
+
+def get_prop_validator(types: Dict[str, type], defaults: Dict[str, Any], key: Hashable = None) -> PropValidator:
+    """Return the compiled validator for a component's prop types, cached under `key` if given"""
+
+    if key is None:
+        key = (tuple((name, id(expected)) for name, expected in types.items()), frozenset(defaults))
+
+    validator = _prop_validators.get(key)
+    if validator is None or not validator.matches(types, defaults):
+        if len(_prop_validators) >= MAX_CACHED_PROP_VALIDATORS:
+            _prop_validators.clear()
+        validator = _prop_validators[key] = PropValidator(types, defaults)
+
+    return validator
+
+
 def check_prop_types(
     *,
     attributes: Dict[str, Any],
     types: Dict[str, type],
     defaults: Dict[str, Any],
+    constants: Optional[ConstantProps] = None,
+    key: Hashable = None,
 ) -> List[PropError]:
-    """Check that props are of the correct type"""
-
-    errors = []
-
-    # Check for missing props
-    for name, expected in types.items():
-        if name not in attributes:
-            if get_origin(expected) is Union and type(None) in get_args(expected):
-                # Props with Optional types are not required
-                continue
-            elif name in defaults:
-                # Props with defaults are not required
-                continue
-            else:
-                # Prop is missing and has no default value
-                errors.append(
-                    PropError(
-                        error="missing",
-                        name=name,
-                        expected=expected,
-                        actual=None,
-                    )
-                )
-
-    # Check for invalid props
-    for name, actual in attributes.items():
-        if name in types:
-            expected = types[name]
-            try:
-                check_type(name, actual, expected)
-            except TypeError:
-                errors.append(
-                    PropError(
-                        error="invalid",
-                        name=name,
-                        expected=expected,
-                        actual=type(actual),
-                    )
-                )
-
-    # Check for extra props
-    for name, actual in attributes.items():
-        if name not in types:
-            errors.append(
-                PropError(
-                    error="extra",
-                    name=name,
-                    expected=None,
-                    actual=type(actual),
-                )
-            )
+    """
+    Check that props are of the correct type, reusing earlier results for constant props if given. `key` identifies
+    the component the types are from, so its validator is reused for as long as its types stay the same.
+    """
 
-    return errors
+    return get_prop_validator(types, defaults, key)(attributes, constants)
 
 
 error_message_templates = {
@@ -161,3 +342,19 @@ def render_error_html(*, errors: List[PropError], tag_name: str, template_name:
     """
 
     return mark_safe(data_html)  # type: ignore
+
+
+def log_prop_errors(*, errors: List[PropError], tag_name: str, template_name: str, lineno: int) -> None:
+    """Output errors to the `slippers` logger"""
+
+    # Remove # from tag name
+    tag_name = tag_name.lstrip("#")
+
+    for error in errors:
+        message = error_message_templates[error.error].format(
+            name=error.name,
+            component=tag_name,
+            expected=get_type_name(error.expected),
+            actual=get_type_name(error.actual),
+        )
+        logger.warning("%s (%s, line %s)", message, template_name, lineno)
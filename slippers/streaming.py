@@ -0,0 +1,216 @@
+"""
+Streaming template rendering.
+
+Templates are rendered node by node into a generator instead of into a single string, so the output before a slow
+component can be sent while the component is still rendering:
+
+    return StreamingHttpResponse(stream_template("reports/report.html", {"rows": rows}, request))
+
+Components, and the `extends`, `block`, `for`, `if`, and `with` tags are streamed through. Any other node is rendered
+as a whole when it's reached.
+"""
+
+from typing import Any, Callable, Dict, Iterator, Optional, Union
+
+from django.template import Template
+from django.template.base import Node, NodeList, TextNode, VariableDoesNotExist
+from django.template.context import make_context
+from django.template.defaulttags import ForNode, IfNode, WithNode
+from django.template.loader import get_template
+from django.template.loader_tags import BLOCK_CONTEXT_KEY, BlockContext, BlockNode, ExtendsNode
+
+
+class Flush:
+    """Marks a point at which the output so far should be sent"""
+
+
+# Yielded by nodes that stream, around parts that may take a while to render
+FLUSH = Flush()
+
+
+def stream_node(node: Node, context, method: str = "stream") -> Iterator[Any]:
+    """
+    Stream a node. Nodes that have the method named by `method`, like components, stream themselves.
+    `slippers.asynchronous` walks templates with its own method.
+    """
+    stream = getattr(node, method, None)
+    if stream is not None:
+        yield from stream(context)
+        return
+
+    streamer = NODE_STREAMERS.get(type(node))
+    if streamer is not None:
+        yield from streamer(node, context, method)
+        return
+
+    yield node.render_annotated(context)
+
+
+def stream_nodelist(nodelist: NodeList, context, method: str = "stream") -> Iterator[Any]:
+    for node in nodelist:
+        yield from stream_node(node, context, method)
+
+
+def stream_rendered(template: Template, context, method: str = "stream") -> Iterator[Any]:
+    """Stream a template the way `Template.render` renders it"""
+    with context.render_context.push_state(template):
+        if context.template is None:
+            with context.bind_template(template):
+                context.template_name = template.name
+                yield from stream_nodelist(template.nodelist, context, method)
+        else:
+            yield from stream_nodelist(template.nodelist, context, method)
+
+
+# The following follow the render methods of the nodes they stream
+
+
+def stream_extends(node: ExtendsNode, context, method):
+    compiled_parent = node.get_parent(context)
+
+    if BLOCK_CONTEXT_KEY not in context.render_context:
+        context.render_context[BLOCK_CONTEXT_KEY] = BlockContext()
+    block_context = context.render_context[BLOCK_CONTEXT_KEY]
+    block_context.add_blocks(node.blocks)
+
+    for parent_node in compiled_parent.nodelist:
+        if not isinstance(parent_node, TextNode):
+            if not isinstance(parent_node, ExtendsNode):
+                blocks = {n.name: n for n in compiled_parent.nodelist.get_nodes_by_type(BlockNode)}
+                block_context.add_blocks(blocks)
+            break
+
+    with context.render_context.push_state(compiled_parent, isolated_context=False):
+        yield from stream_nodelist(compiled_parent.nodelist, context, method)
+
+
+def stream_block(node: BlockNode, context, method):
+    block_context = context.render_context.get(BLOCK_CONTEXT_KEY)
+
+    with context.push():
+        if block_context is None:
+            context["block"] = node
+            yield from stream_nodelist(node.nodelist, context, method)
+        else:
+            push = block = block_context.pop(node.name)
+            if block is None:
+                block = node
+            block = type(node)(block.name, block.nodelist)
+            block.context = context
+            context["block"] = block
+            yield from stream_nodelist(block.nodelist, context, method)
+            if push is not None:
+                block_context.push(node.name, push)
+
+
+def stream_for(node: ForNode, context, method):
+    parentloop = context["forloop"] if "forloop" in context else {}
+
+    with context.push():
+        values = node.sequence.resolve(context, ignore_failures=True)
+        if values is None:
+            values = []
+        if not hasattr(values, "__len__"):
+            values = list(values)
+        len_values = len(values)
+        if len_values < 1:
+            yield from stream_nodelist(node.nodelist_empty, context, method)
+            return
+
+        if node.is_reversed:
+            values = reversed(values)
+        num_loopvars = len(node.loopvars)
+        unpack = num_loopvars > 1
+
+        loop_dict = context["forloop"] = {"parentloop": parentloop}
+        for i, item in enumerate(values):
+            loop_dict["counter0"] = i
+            loop_dict["counter"] = i + 1
+            loop_dict["revcounter"] = len_values - i
+            loop_dict["revcounter0"] = len_values - i - 1
+            loop_dict["first"] = i == 0
+            loop_dict["last"] = i == len_values - 1
+
+            pop_context = False
+            if unpack:
+                try:
+                    len_item = len(item)
+                except TypeError:
+                    len_item = 1
+                if num_loopvars != len_item:
+                    raise ValueError(f"Need {num_loopvars} values to unpack in for loop; got {len_item}. ")
+                pop_context = True
+                context.update(dict(zip(node.loopvars, item)))
+            else:
+                context[node.loopvars[0]] = item
+
+            yield from stream_nodelist(node.nodelist_loop, context, method)
+
+            if pop_context:
+                context.pop()
+
+
+def stream_if(node: IfNode, context, method):
+    for condition, nodelist in node.conditions_nodelists:
+        if condition is not None:
+            try:
+                match = condition.eval(context)
+            except VariableDoesNotExist:
+                match = None
+        else:
+            match = True
+
+        if match:
+            yield from stream_nodelist(nodelist, context, method)
+            return
+
+
+def stream_with(node: WithNode, context, method):
+    values = {key: value.resolve(context) for key, value in node.extra_context.items()}
+    with context.push(**values):
+        yield from stream_nodelist(node.nodelist, context, method)
+
+
+NODE_STREAMERS: Dict[type, Callable] = {
+    ExtendsNode: stream_extends,
+    BlockNode: stream_block,
+    ForNode: stream_for,
+    IfNode: stream_if,
+    WithNode: stream_with,
+}
+
+
+def join_chunks(pieces: Iterator[Union[str, Flush]]) -> Iterator[str]:
+    """Join streamed output into chunks, one for each point at which it should be sent"""
+    buffer = []
+
+    for piece in pieces:
+        if piece is FLUSH:
+            if buffer:
+                yield "".join(buffer)
+                buffer = []
+        elif piece:
+            buffer.append(piece)
+
+    if buffer:
+        yield "".join(buffer)
+
+
+def stream_template(
+    template: Union[str, Template],
+    context: Optional[Dict] = None,
+    request=None,
+    using: Optional[str] = None,
+) -> Iterator[str]:
+    """
+    Render a template, or the name of one, into chunks of output for a StreamingHttpResponse.
+
+    Output is split before and after each component, so everything rendered before a component is sent before it.
+    """
+    if isinstance(template, str):
+        template = get_template(template, using=using)
+
+    # Unwrap templates returned by template backends
+    template = getattr(template, "template", template)
+
+    return join_chunks(stream_rendered(template, make_context(context, request, autoescape=template.engine.autoescape)))
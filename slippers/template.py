@@ -91,6 +91,22 @@ class SlippersFilterExpression(FilterExpression):
         self.is_var = isinstance(var_obj, Variable)
 
 
+def is_constant(expression: FilterExpression) -> bool:
+    """Whether an expression resolves to the same value regardless of the context it's resolved in"""
+    if expression.filters:
+        return False
+
+    if not expression.is_var:
+        return True
+
+    variable = expression.var
+    if variable.translate:
+        return False
+
+    # Number literals, or the True, False, and None names provided by the context's builtins
+    return variable.lookups is None or variable.lookups in (("True",), ("False",), ("None",))
+
+
 ########################################################################################################################
 # Custom token_kwargs
 #
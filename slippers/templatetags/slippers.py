@@ -1,45 +1,100 @@
+import inspect
+import random
 import re
-from typing import Any, Dict, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
 from warnings import warn
 
+from asgiref.sync import sync_to_async
 from django import template
 from django.conf import settings as django_settings
-from django.template import Context, NodeList
-from django.utils.html import format_html
-from django.utils.safestring import mark_safe
-
+from django.template import Context, Engine, NodeList
+from django.template.base import FILTER_SEPARATOR, TextNode, render_value_in_context
+from django.template.loader_tags import ExtendsNode, IncludeNode
+from django.utils import translation
+from django.utils.html import conditional_escape, escape
+from django.utils.safestring import SafeString, mark_safe
+
+from slippers import components, metrics, tracing
+from slippers.asynchronous import join_pieces
+from slippers.cache import freeze, get_component_cache, make_cache_key
+from slippers.components import extract_template_parts, get_component_template  # noqa: F401
 from slippers.conf import settings
-from slippers.props import Props, check_prop_types, render_error_html
-from slippers.template import slippers_token_kwargs
+from slippers.lazy import LazyRender, force_lazy, snapshot_context
+from slippers.props import (
+    ConstantProps,
+    Props,
+    check_prop_types,
+    front_matter_awaits,
+    log_prop_errors,
+    render_error_html,
+)
+from slippers.streaming import FLUSH, stream_nodelist, stream_rendered
+from slippers.template import SlippersFilterExpression, is_constant, slippers_token_kwargs
 
 register = template.Library()
 
+# Characters that can't be in the variable names of a component loop
+INVALID_LOOP_VAR_CHARS = frozenset((" ", '"', "'", "=", FILTER_SEPARATOR))
+
+# Key of the render memo in a render context
+RENDER_MEMO_KEY = "slippers_render_memo"
+
 
 ##
 # Component tags
-def create_component_tag(template_path):
+def create_component_tag(template_path, pure=False, dedupe=False):
     def do_component(parser, token):
         tag_name, *remaining_bits = token.split_contents()
 
         # Block components start with `#`
         # Expect a closing tag
+        slots = {}
         if tag_name[0] == "#":
-            nodelist = parser.parse((f"/{tag_name[1:]}",))
+            nodelist, slots = extract_slots(parser.parse((f"/{tag_name[1:]}",)))
             parser.delete_first_token()
         else:
             nodelist = NodeList()
 
+        # Render the component once for each item in a sequence: `{% button for item in items label=item.name %}`
+        loop_vars = sequence = None
+        if remaining_bits and remaining_bits[0] == "for":
+            loop_vars, sequence, remaining_bits = parse_loop(remaining_bits, token, parser)
+
         # Bits that are not keyword args are interpreted as `True` values
         all_bits = [bit if "=" in bit else f"{bit}=True" for bit in remaining_bits]
 
         raw_attributes = slippers_token_kwargs(all_bits, parser)
 
+        # Attributes set to literals only need to be type checked once
+        constant_attributes = ConstantProps(
+            {key: value.resolve(Context()) for key, value in raw_attributes.items() if is_constant(value)}
+        )
+
+        # Call sites with only literal attributes and static children render the same output every time
+        hoist = (
+            settings.SLIPPERS_HOIST_STATIC_COMPONENTS
+            and sequence is None
+            and not slots
+            and len(constant_attributes.values) == len(raw_attributes)
+            and all(isinstance(node, TextNode) for node in nodelist)
+        )
+
         # Allow component fragment to be assigned to a variable
         target_var = None
         if len(remaining_bits) >= 2 and remaining_bits[-2] == "as":
             target_var = remaining_bits[-1]
 
-        return ComponentNode(
+        components.record_component_use(tag_name, parser.origin)
+
+        node_kwargs = {}
+        node_class = ComponentNode
+        if sequence is not None:
+            node_class = ComponentLoopNode
+            node_kwargs = {"loop_vars": loop_vars, "sequence": sequence}
+
+        return node_class(
+            **node_kwargs,
             tag_name=tag_name,
             nodelist=nodelist,
             template_path=template_path,
@@ -47,31 +102,73 @@ def create_component_tag(template_path):
             origin_template_name=parser.origin.template_name,
             origin_lineno=token.lineno,
             target_var=target_var,
+            constant_attributes=constant_attributes,
+            pure=pure,
+            dedupe=dedupe,
+            hoist=hoist,
+            slots=slots,
         )
 
     return do_component
 
 
-def extract_template_parts(code: str) -> Tuple[str, str]:
-    """Extract the front matter and template sections from a component's code"""
+def parse_loop(bits, token, parser) -> Tuple[List[str], SlippersFilterExpression, List[str]]:
+    """
+    Parse the loop of a component tag the way the `for` tag parses its loop, so `for name, score in rows` works.
+    Returns the loop variables, the sequence, and the remaining bits.
+    """
+    try:
+        in_index = bits.index("in")
+    except ValueError:
+        in_index = None
+
+    if in_index is None or in_index < 2 or in_index + 1 >= len(bits):
+        raise template.TemplateSyntaxError(
+            f"Component loops should use the format '{{% component for x in y %}}': {token.contents}"
+        )
+
+    loop_vars = re.split(r" *, *", " ".join(bits[1:in_index]))
+    for var in loop_vars:
+        if not var or not INVALID_LOOP_VAR_CHARS.isdisjoint(var):
+            raise template.TemplateSyntaxError(f"Component loop received an invalid variable name: {token.contents}")
+
+    return loop_vars, SlippersFilterExpression(bits[in_index + 1], parser), bits[in_index + 2 :]
+
+
+def extract_slots(nodelist: NodeList) -> Tuple[NodeList, Dict[str, NodeList]]:
+    """Separate the slots filled in a block component from its children"""
+    slot_nodes = [node for node in nodelist if isinstance(node, SlotNode)]
+    if not slot_nodes:
+        return nodelist, {}
+
+    slots = {}
+    for node in slot_nodes:
+        if node.name in slots:
+            raise template.TemplateSyntaxError(f"The '{node.name}' slot is filled more than once.")
+        slots[node.name] = node.nodelist
+
+    children = NodeList(node for node in nodelist if not isinstance(node, SlotNode))
+
+    return children, slots
 
-    # Components that have front matter must start with `---`
-    if not code.strip().startswith("---"):
-        return "", code
 
-    # Split the code into front matter and template
-    parts = re.split(r"^---\s*$", code, maxsplit=2, flags=re.MULTILINE)
+def get_render_memo(context) -> Dict:
+    """Return the output of deduplicated components rendered so far, shared by all contexts within a render"""
 
-    # Content only
-    if len(parts) == 1:
-        return "", parts[0]
+    # Component contexts share the memo of the render they're part of
+    render_memo = getattr(context, "_slippers_render_memo", None)
+    if render_memo is not None:
+        return render_memo
 
-    # Front matter and content
-    if len(parts) == 3:
-        return parts[1].strip(), parts[2]  # Don't strip template
+    # Otherwise the memo is kept in the state the outermost template pushes onto the render context, which only
+    # lasts for one top-level render, even if the same context is rendered again
+    render_context = context.render_context
+    state = render_context.dicts[1] if len(render_context.dicts) > 1 else render_context.dicts[0]
 
-    # Any other case, just render the template as is
-    return "", code
+    render_memo = state.get(RENDER_MEMO_KEY)
+    if render_memo is None:
+        render_memo = state[RENDER_MEMO_KEY] = {}
+    return render_memo
 
 
 class ComponentNode(template.Node):
@@ -84,6 +181,11 @@ class ComponentNode(template.Node):
         origin_template_name,
         origin_lineno,
         target_var=None,
+        constant_attributes=None,
+        pure=False,
+        dedupe=False,
+        hoist=False,
+        slots=None,
     ):
         self.tag_name = tag_name
         self.nodelist = nodelist
@@ -92,55 +194,377 @@ class ComponentNode(template.Node):
         self.origin_template_name = origin_template_name
         self.origin_lineno = origin_lineno
         self.target_var = target_var
+        self.constant_attributes = constant_attributes
+        self.pure = pure
+        self.dedupe = dedupe
+        self.hoist = hoist
+        self.slots = slots or {}
+
+        # Output of a hoisted call site per engine, language, and autoescape, with the generation it was rendered in
+        self._hoisted = {}
+
+        # Resolved templates memoized per engine, along with the generation they were resolved in
+        self._templates = {}
+
+        # Number of renders type checked by the warm-up mode
+        self._warmup_checks = 0
+
+    def get_template(self, engine):
+        """Return the component's template, resolving it only once per engine"""
+        cached = self._templates.get(engine)
+        if cached is not None and cached[0] == components.generation:
+            return cached[1]
+
+        template = engine.get_template(self.template_path)
+        self._templates[engine] = (components.generation, template)
+
+        return template
 
+    def get_nodes_by_type(self, nodetype):
+        # Slots are kept apart from the children, but are searched like them, so things like `block` tags and
+        # `include`s in slots are found
+        nodes = super().get_nodes_by_type(nodetype)
+        for nodelist in self.slots.values():
+            nodes.extend(nodelist.get_nodes_by_type(nodetype))
+        return nodes
+
+    def lazy_slots(self, context) -> Dict[str, LazyRender]:
+        """Return the slots filled in this call site, rendered in the parent context when they're used"""
+        return {name: LazyRender(nodelist, context) for name, nodelist in self.slots.items()}
+
+    def get_type_checking_output(self) -> Optional[str]:
+        """Return where prop errors should be reported for this render, or None to skip type checking"""
+        if settings.SLIPPERS_RUNTIME_TYPE_CHECKING:
+            return "browser"
+
+        if self._warmup_checks < settings.SLIPPERS_TYPE_CHECKING_WARMUP_RENDERS:
+            self._warmup_checks += 1
+            return "log"
+
+        sample_rate = settings.SLIPPERS_TYPE_CHECKING_SAMPLE_RATE
+        if sample_rate and random.random() < sample_rate:
+            return "log"
+
+        return None
+
+    @tracing.traced
     def render(self, context):
-        children = self.nodelist.render(context) if self.nodelist else ""
+        timer = metrics.start_timer()
+
+        if self.hoist:
+            output = self.render_hoisted(context)
+            if output is not None:
+                if timer:
+                    metrics.record(self, timer, output)
+                return self.output(context, output)
+
+        children = LazyRender(self.nodelist, context) if self.nodelist else ""
 
         attributes = {key: value.resolve(context) for key, value in self.raw_attributes.items()}
 
-        template = context.template.engine.get_template(self.template_path)
+        template = self.get_template(context.template.engine)
+        component = get_component_template(template)
 
-        source_front_matter = extract_template_parts(template.source)[0]
+        if timer:
+            timer.lap("resolve")
 
-        prop_errors = None
+        slots = self.lazy_slots(context) if self.slots else None
+
+        output = self.render_cached(context, template, component, attributes, children, timer=timer, slots=slots)
+
+        if timer:
+            metrics.record(self, timer, output)
+
+        return self.output(context, output)
+
+    def stream(self, context):
+        """Render the component in parts, flushing before and after it, for `slippers.streaming`"""
+
+        # Output that has to be complete before it's used is rendered as usual
+        if self.target_var or self.pure or self.dedupe or self.hoist:
+            yield self.render_annotated(context)
+            return
+
+        yield FLUSH
+
+        children = LazyRender(self.nodelist, context) if self.nodelist else ""
+        attributes = {key: value.resolve(context) for key, value in self.raw_attributes.items()}
+
+        template = self.get_template(context.template.engine)
+        component = get_component_template(template)
+
+        attributes, prop_errors, type_checking_output = self.check_props(
+            context.get("request"), template, component, attributes
+        )
+
+        component_context = self.new_component_context(context)
+        component_context.update({**attributes, **self.lazy_slots(context), "children": children})
+
+        yield from stream_rendered(component.body, component_context)
+
+        if prop_errors:
+            yield self.report_prop_errors("", prop_errors, type_checking_output)
+
+        yield FLUSH
+
+    def stream_async(self, context):
+        """Render the component in parts for `slippers.asynchronous`, deferring it if its front matter awaits"""
+
+        # Output that has to be complete before it's used is rendered as usual
+        if self.target_var or self.pure or self.dedupe or self.hoist:
+            yield self.render_annotated(context)
+            return
+
+        template = self.get_template(context.template.engine)
+        yield from self.stream_component_async(context, template, get_component_template(template))
+
+    def stream_component_async(self, context, template, component):
+        children = list(stream_nodelist(self.nodelist, context, "stream_async")) if self.nodelist else []
+        slots = {
+            name: list(stream_nodelist(nodelist, context, "stream_async")) for name, nodelist in self.slots.items()
+        }
+        attributes = {key: value.resolve(context) for key, value in self.raw_attributes.items()}
+
+        # Everything taken from the parent context is resolved now, as the context changes before a deferred
+        # component is rendered
+        args = (self.new_component_context(context), context.get("request"), template, component, attributes)
+
+        if any(inspect.isawaitable(piece) for pieces in (children, *slots.values()) for piece in pieces) or (
+            component.front_matter and front_matter_awaits(component.front_matter, template.origin.name)
+        ):
+            yield self.arender_component(*args, children, slots)
+        else:
+            slots = {name: mark_safe("".join(pieces)) for name, pieces in slots.items()}
+            yield from self.stream_body_async(*args, mark_safe("".join(children)), slots)
+
+    async def arender_component(self, component_context, request, template, component, attributes, children, slots):
+        """Render a deferred component once its children and slots are ready, awaiting its front matter"""
+        children = await join_pieces(children)
+        slots = {name: await join_pieces(pieces) for name, pieces in slots.items()}
+
+        props = None
+        if component.front_matter:
+            props = await Props.afrom_string(attributes, component.front_matter, template.origin.name)
+
+        # The template is rendered in a thread, where synchronous code such as the ORM can be used
+        pieces = await sync_to_async(
+            lambda: list(
+                self.stream_body_async(
+                    component_context, request, template, component, attributes, children, slots, props
+                )
+            )
+        )()
+
+        return await join_pieces(pieces)
+
+    def stream_body_async(
+        self, component_context, request, template, component, attributes, children, slots, props=None
+    ):
+        attributes, prop_errors, type_checking_output = self.check_props(
+            request, template, component, attributes, props
+        )
+        component_context.update({**attributes, **slots, "children": children})
+
+        yield from stream_rendered(component.body, component_context, "stream_async")
+
+        if prop_errors:
+            yield self.report_prop_errors("", prop_errors, type_checking_output)
+
+    def render_hoisted(self, context) -> Optional[SafeString]:
+        """
+        Return the output of a call site with only literal attributes and static children, rendering it on first use.
+
+        Returns None if the component may depend on `request`, in which case it's rendered as usual.
+        """
+        engine = context.template.engine
+        language = translation.get_language() if django_settings.USE_I18N else None
+        hoist_key = (engine, language, context.autoescape)
+
+        cached = self._hoisted.get(hoist_key)
+        if cached is not None and cached[0] == components.generation:
+            return cached[1]
+
+        generation = components.generation
+        template = self.get_template(engine)
+
+        output = None
+        if not uses_request(template, engine):
+            children = self.nodelist.render(context) if self.nodelist else ""
+            attributes = {key: value.resolve(context) for key, value in self.raw_attributes.items()}
+
+            # Render without the parent context, so `request` isn't passed on to nested components
+            output, prop_errors = self.render_component(
+                Context(autoescape=context.autoescape), template, get_component_template(template), attributes, children
+            )
+            if prop_errors:
+                return output
+
+        self._hoisted[hoist_key] = (generation, output)
+
+        return output
+
+    @tracing.traced
+    def render_props(self, context, attributes, children):
+        """Render the component with already resolved attributes and children, like `render_component` does"""
+        timer = metrics.start_timer()
+
+        template = self.get_template(Engine.get_default())
+        component = get_component_template(template)
+
+        if timer:
+            timer.lap("resolve")
+
+        output = self.render_cached(context, template, component, attributes, children, timer=timer)
+
+        if timer:
+            metrics.record(self, timer, output)
+
+        return output
+
+    def render_cached(
+        self, context, template, component, attributes, children, component_context=None, timer=None, slots=None
+    ):
+        """Render the component, reusing output from the render memo or component cache where allowed"""
+        render_memo = get_render_memo(context)
+
+        # Output is looked up by props, children, and slots, so they're rendered up front
+        content = children
+        if self.pure or self.dedupe:
+            attributes = force_lazy(attributes)
+            children = content = str(children)
+            if slots:
+                content = (children, tuple((name, str(slot)) for name, slot in sorted(slots.items())))
+
+        # Identical renders of deduplicated components are only done once per render
+        memo_key = self.get_memo_key(attributes, content, context) if self.dedupe else None
+        if memo_key is not None and memo_key in render_memo:
+            return render_memo[memo_key]
+
+        # Output of pure components only depends on their props and children
+        cache_key = None
+        if self.pure:
+            cache_key = make_cache_key(
+                self.template_path, component.fingerprint, attributes, content, context.autoescape
+            )
+            if cache_key is not None:
+                output = get_component_cache().get(cache_key)
+                if output is not None:
+                    return mark_safe(output)
+
+        output, prop_errors = self.render_component(
+            context, template, component, attributes, children, component_context, timer, slots
+        )
+
+        if cache_key is not None and not prop_errors:
+            get_component_cache().set(cache_key, output)
+
+        if memo_key is not None:
+            render_memo[memo_key] = output
+
+        return output
+
+    def get_memo_key(self, attributes, children, context):
+        try:
+            return (self.template_path, freeze(attributes), children, context.autoescape)
+        except TypeError:
+            return None
+
+    def render_component(
+        self, context, template, component, attributes, children, component_context=None, timer=None, slots=None
+    ):
+        """
+        Check the component's props and render its template. Returns the output and any prop errors.
+
+        An existing `component_context` can be passed in to be reused, in which case it's left as it was found.
+        A `timer` is passed in when metrics are on. `slots` maps the names of filled slots to their output.
+        """
 
         # Stage 1: Prop checking
-        if source_front_matter:
-            props = Props.from_string(attributes, source_front_matter)
+        attributes, prop_errors, type_checking_output = self.check_props(
+            context.get("request"), template, component, attributes
+        )
+
+        if timer:
+            timer.lap("check")
+
+        # Stage 2: Render template
+        if component_context is None:
+            component_context = self.new_component_context(context)
+
+        depth = len(component_context.dicts)
+        component_context.update({**attributes, **(slots or {}), "children": children})
+        try:
+            output = component.body.render(component_context)
+        finally:
+            # Also drop anything pushed by tags like `var`
+            del component_context.dicts[depth:]
 
-            if settings.SLIPPERS_RUNTIME_TYPE_CHECKING:
+        if timer:
+            timer.lap("render")
+
+        if prop_errors:
+            output = self.report_prop_errors(output, prop_errors, type_checking_output)
+
+        return output, prop_errors
+
+    def check_props(self, request, template, component, attributes, props=None):
+        """
+        Run the component's front matter and check its props. Returns the attributes to render the component with,
+        any prop errors, and where to report them.
+
+        `props` can be passed in if the front matter has already been run.
+        """
+        prop_errors = None
+        type_checking_output = None
+
+        if component.front_matter:
+            # Front matter and type checking expect strings where lazily rendered output is passed on
+            attributes = force_lazy(attributes)
+
+            if props is None:
+                props = Props.from_string(attributes, component.front_matter, template.origin.name)
+
+            type_checking_output = self.get_type_checking_output()
+            if type_checking_output:
                 prop_errors = check_prop_types(
                     attributes=attributes,
                     types=props.types,
                     defaults=props.defaults,
+                    constants=self.constant_attributes,
+                    key=(template.origin.name, component.fingerprint),
                 )
 
             # Load prop defaults into props
             attributes = {**props}
 
         # Inject request from parent context if available and not already passed explicitly
-        request = context.get("request")
         if request is not None and "request" not in attributes:
             attributes["request"] = request
 
-        # Stage 2: Render template
-        raw_output = template.render(Context({**attributes, "children": children}, autoescape=context.autoescape))
+        return attributes, prop_errors, type_checking_output
 
-        output_template_section = mark_safe(extract_template_parts(raw_output)[1])
+    def new_component_context(self, context):
+        component_context = Context(autoescape=context.autoescape)
+        component_context._slippers_render_memo = get_render_memo(context)
+        return component_context
 
-        if prop_errors and (
-            "console" in settings.SLIPPERS_TYPE_CHECKING_OUTPUT or "overlay" in settings.SLIPPERS_TYPE_CHECKING_OUTPUT
-        ):
+    def report_prop_errors(self, output, prop_errors, type_checking_output):
+        error_details = {
+            "errors": prop_errors,
+            "tag_name": self.tag_name,
+            "template_name": self.origin_template_name,
+            "lineno": self.origin_lineno,
+        }
+
+        if type_checking_output == "log":
+            log_prop_errors(**error_details)
+        elif "console" in settings.SLIPPERS_TYPE_CHECKING_OUTPUT or "overlay" in settings.SLIPPERS_TYPE_CHECKING_OUTPUT:
             # Append prop errors to output
-            output = output_template_section + render_error_html(  # type: ignore
-                errors=prop_errors,
-                tag_name=self.tag_name,
-                template_name=self.origin_template_name,
-                lineno=self.origin_lineno,
-            )
-        else:
-            output = output_template_section
+            output = output + render_error_html(**error_details)  # type: ignore
 
+        return output
+
+    def output(self, context, output):
         if self.target_var:
             context[self.target_var] = output
             return ""
@@ -148,46 +572,231 @@ class ComponentNode(template.Node):
         return output
 
 
-def register_components(components: Dict[str, str], target_register: template.Library = None) -> None:
+class ComponentLoopNode(ComponentNode):
+    """Renders a component for each item in a sequence, looking up the component and its context only once"""
+
+    def __init__(self, loop_vars, sequence, **kwargs):
+        super().__init__(**kwargs)
+        self.loop_vars = loop_vars
+        self.sequence = sequence
+
+    @tracing.traced
+    def render(self, context):
+        return self.output(context, mark_safe("".join(self.render_items(context))))
+
+    def stream(self, context):
+        if self.target_var:
+            yield self.render_annotated(context)
+            return
+
+        for output in self.render_items(context):
+            yield output
+            yield FLUSH
+
+    def stream_async(self, context):
+        if self.target_var or self.pure or self.dedupe:
+            yield self.render_annotated(context)
+            return
+
+        sequence = self.sequence.resolve(context, ignore_failures=True)
+        if not sequence:
+            return
+
+        template = self.get_template(context.template.engine)
+        component = get_component_template(template)
+
+        # Items that await are rendered concurrently
+        for _ in self.iterate(context, sequence):
+            yield from self.stream_component_async(context, template, component)
+
+    def iterate(self, context, sequence):
+        """Set the loop variables in the context for each item in the sequence"""
+        with context.push():
+            for item in sequence:
+                if len(self.loop_vars) == 1:
+                    context[self.loop_vars[0]] = item
+                else:
+                    values = list(item)
+                    if len(values) != len(self.loop_vars):
+                        raise ValueError(f"Need {len(self.loop_vars)} values to unpack in for loop; got {len(values)}.")
+                    for name, value in zip(self.loop_vars, values):
+                        context[name] = value
+
+                yield item
+
+    def render_items(self, context):
+        """Yield the output of the component for each item in the sequence"""
+        sequence = self.sequence.resolve(context, ignore_failures=True)
+        if not sequence:
+            return
+
+        template = self.get_template(context.template.engine)
+        component = get_component_template(template)
+        component_context = self.new_component_context(context)
+
+        for _ in self.iterate(context, sequence):
+            timer = metrics.start_timer()
+
+            children = LazyRender(self.nodelist, context) if self.nodelist else ""
+            attributes = {key: value.resolve(context) for key, value in self.raw_attributes.items()}
+
+            if timer:
+                timer.lap("resolve")
+
+            slots = self.lazy_slots(context) if self.slots else None
+
+            output = self.render_cached(
+                context, template, component, attributes, children, component_context, timer, slots
+            )
+
+            if timer:
+                metrics.record(self, timer, output)
+
+            yield output
+
+
+def uses_request(template, engine, seen=None) -> bool:
+    """Whether a component template, or a component it renders, may read `request`"""
+    if "request" in template.source:
+        return True
+
+    # Included and extended templates aren't followed
+    if template.nodelist.get_nodes_by_type((IncludeNode, ExtendsNode)):
+        return True
+
+    seen = set() if seen is None else seen
+    for node in template.nodelist.get_nodes_by_type(ComponentNode):
+        if node.template_path not in seen:
+            seen.add(node.template_path)
+            if uses_request(node.get_template(engine), engine, seen):
+                return True
+
+    return False
+
+
+def parse_component_definition(definition: Union[str, Dict[str, Any]]) -> Tuple[str, Dict[str, Any]]:
+    """Components are either a template path, or a mapping of a template path and options"""
+    if isinstance(definition, dict):
+        return definition["template"], {
+            "pure": definition.get("pure", False),
+            "dedupe": definition.get("dedupe", False),
+        }
+
+    return definition, {}
+
+
+# Nodes for registered components, by name, used to render them from Python
+component_registry: Dict[str, ComponentNode] = {}
+
+
+def register_components(
+    components: Dict[str, Union[str, Dict[str, Any]]], target_register: template.Library = None
+) -> None:
     if target_register is None:
         target_register = register
-    for tag_name, template_path in components.items():
+    for tag_name, definition in components.items():
+        template_path, options = parse_component_definition(definition)
+
         # Inline component
-        target_register.tag(f"{tag_name}", create_component_tag(template_path))
+        target_register.tag(f"{tag_name}", create_component_tag(template_path, **options))
 
         # Block component
-        target_register.tag(f"#{tag_name}", create_component_tag(template_path))
+        target_register.tag(f"#{tag_name}", create_component_tag(template_path, **options))
+
+        # Rendering from Python, which only knows about the components in this library
+        if target_register is not register:
+            continue
+
+        component_registry[tag_name] = ComponentNode(
+            tag_name=tag_name,
+            nodelist=NodeList(),
+            template_path=template_path,
+            raw_attributes={},
+            origin_template_name=None,
+            origin_lineno=None,
+            **options,
+        )
+
+
+def render_component(name: str, children: Optional[str] = None, **props) -> SafeString:
+    """Render a registered component without parsing a template"""
+    try:
+        node = component_registry[name]
+    except KeyError:
+        raise KeyError(f"No component named '{name}' has been registered.") from None
+
+    return node.render_props(Context(), props, children or "")
 
 
 ##
 # attr tag
-def attr_string(key: str, value: Any):
+def warn_underscore_attr(key: str) -> None:
+    warn(
+        f"Underscores in attribute names are deprecated. Use hyphens instead. {key}",
+        DeprecationWarning,
+        stacklevel=3,
+    )
+
+
+def render_attr(key: str, name: str, value: Any) -> str:
+    """Render an attribute whose HTML `name` has already been escaped"""
     if isinstance(value, bool):
         return key if value else ""
 
+    # Same as format_html('{}="{}"', ...), without formatting and escaping the name on every call
+    return f'{name}="{conditional_escape(value)}"'
+
+
+def attr_name(key: str) -> str:
     # Replace `_` with `-`
     # an underscore is not a valid character in an HTML attribute name
     # a hyphen is not a valid character in a Django template variable name
     # So we can use an underscore when we want to use a hyphen in an HTML attribute name
     # e.g. `aria_role` turns into `aria-role`
-    if "_" in key:
-        warn(
-            f"Underscores in attribute names are deprecated. Use hyphens instead. {key}",
-            DeprecationWarning,
-            stacklevel=2,
-        )
-    key = key.replace("_", "-")
+    return escape(key.replace("_", "-"))
 
-    return format_html('{}="{}"', key, value)
+
+def attr_string(key: str, value: Any):
+    if "_" in key and not isinstance(value, bool):
+        warn_underscore_attr(key)
+
+    return render_attr(key, attr_name(key), value)
 
 
 class AttrsNode(template.Node):
     def __init__(self, attr_map: Dict):
         self.attr_map = attr_map
 
+        # Attributes in order, either as rendered strings for literal values, or as (key, name, expression) to resolve
+        # on each render. Consecutive literal attributes are rendered together.
+        self.segments = []
+        for key, value in attr_map.items():
+            if not is_constant(value):
+                self.segments.append((key, attr_name(key), value))
+                continue
+
+            constant = value.resolve(Context())
+            rendered = render_attr(key, attr_name(key), constant) if constant else ""
+            if not rendered:
+                continue
+
+            if self.segments and isinstance(self.segments[-1], str):
+                self.segments[-1] = f"{self.segments[-1]} {rendered}"
+            else:
+                self.segments.append(rendered)
+
     def render(self, context):
-        values = {key: value.resolve(context) for key, value in self.attr_map.items()}
-        attr_strings = [attr_string(key, value) for key, value in values.items() if value]
+        attr_strings = []
+        for segment in self.segments:
+            if isinstance(segment, str):
+                attr_strings.append(segment)
+                continue
+
+            key, name, expression = segment
+            value = expression.resolve(context)
+            if value:
+                attr_strings.append(render_attr(key, name, value))
+
         return " ".join(attr_strings)
 
 
@@ -198,6 +807,12 @@ def do_attrs(parser, token):
     # Format all tokens to be attr=attr so we can use token_kwargs() on it
     all_attrs = [attr if "=" in attr else f"{attr}={attr}" for attr in attrs]
     attr_map = slippers_token_kwargs(all_attrs, parser)
+
+    # Warn once, when the template is parsed
+    for key in attr_map:
+        if "_" in key:
+            warn_underscore_attr(key)
+
     return AttrsNode(attr_map)
 
 
@@ -229,52 +844,100 @@ def do_var(parser, token):
 
 
 ##
-# match filter
+# match filter and tag
+MATCH_SYNTAX = 'The syntax for match is {{ variable|match:"key1:value1,key2:value2,key3:value3" }}'
+
+
+@lru_cache(maxsize=256)
+def parse_match_mapping(mapping: str) -> Dict[str, str]:
+    """Parse a `key1:value1,key2:value2` mapping. Mappings are usually literals, so each is only parsed once."""
+    values_map = {}
+
+    for item in mapping.split(","):
+        key, *value = item.split(":")
+
+        key = key.strip()
+        value = ":".join(value).strip()
+
+        if not key or not value:
+            raise template.TemplateSyntaxError(MATCH_SYNTAX)
+
+        values_map[key] = value
+
+    return values_map
+
+
 @register.filter(name="match")
 def do_match(match_key, mapping):
-    items = mapping.split(",")
-    values_map = {}
+    return parse_match_mapping(mapping).get(match_key, "")
 
-    error_message = 'The syntax for match is {{ variable|match:"key1:value1,key2:value2,key3:value3" }}'
 
-    for item in items:
-        try:
-            key, *value = item.split(":")
+class MatchNode(template.Node):
+    def __init__(self, match_key, values_map, target_var=None):
+        self.match_key = match_key
+        self.values_map = values_map
+        self.target_var = target_var
 
-            key = key.strip()
-            value = ":".join(value).strip()
+    def render(self, context):
+        value = self.values_map.get(self.match_key.resolve(context), "")
 
-            if not key or not value:
-                raise template.TemplateSyntaxError(error_message)
+        if self.target_var:
+            context[self.target_var] = value
+            return ""
 
-            values_map[key] = value
-        except ValueError as e:
-            if django_settings.DEBUG:
-                raise template.TemplateSyntaxError(error_message) from e
-            continue
+        return render_value_in_context(value, context)
+
+
+@register.tag(name="match")
+def do_match_tag(parser, token):
+    """Like the `match` filter, but the mapping is parsed, and checked, once when the template is parsed"""
+    error_message = 'The syntax for match is {% match variable "key1:value1,key2:value2" [as variable_name] %}'
+
+    bits = token.split_contents()
+    target_var = None
+    if len(bits) == 5 and bits[3] == "as":
+        target_var = bits[4]
+        bits = bits[:3]
+
+    if len(bits) != 3:
+        raise template.TemplateSyntaxError(error_message)
 
-    return values_map.get(match_key, "")
+    mapping = parser.compile_filter(bits[2])
+    if mapping.filters or not isinstance(mapping.var, str):
+        raise template.TemplateSyntaxError(f"The mapping passed to match must be a string literal. {error_message}")
+
+    return MatchNode(parser.compile_filter(bits[1]), parse_match_mapping(mapping.var), target_var)
 
 
 ##
 # fragment tag
 class FragmentNode(template.Node):
-    def __init__(self, nodelist, target_var):
+    def __init__(self, nodelist, target_var, lazy=False):
         self.nodelist = nodelist
         self.target_var = target_var
+        self.lazy = lazy
 
     def render(self, context):
-        fragment = self.nodelist.render(context) if self.nodelist else ""
+        if not self.nodelist:
+            fragment = ""
+        elif self.lazy:
+            # Rendered when first used, as it would have rendered here
+            fragment = LazyRender(self.nodelist, snapshot_context(context))
+        else:
+            fragment = self.nodelist.render(context)
+
         context[self.target_var] = fragment
         return ""
 
 
 @register.tag(name="fragment")
 def do_fragment(parser, token):
-    error_message = "The syntax for fragment is {% fragment as variable_name %}"
+    error_message = "The syntax for fragment is {% fragment as variable_name [lazy] %}"
 
     try:
-        tag_name, _, target_var = token.split_contents()
+        tag_name, _, target_var, *options = token.split_contents()
+        if options not in ([], ["lazy"]):
+            raise ValueError(options)
 
         nodelist = parser.parse(("endfragment",))
         parser.delete_first_token()
@@ -283,7 +946,40 @@ def do_fragment(parser, token):
             raise template.TemplateSyntaxError(error_message) from e
         return ""
 
-    return FragmentNode(nodelist, target_var)
+    return FragmentNode(nodelist, target_var, lazy=bool(options))
+
+
+##
+# slot tag
+class SlotNode(template.Node):
+    """A named region of a block component. Block components take their slots out of their children when parsed."""
+
+    def __init__(self, name, nodelist):
+        self.name = name
+        self.nodelist = nodelist
+
+    def render(self, context):
+        return ""
+
+
+@register.tag(name="slot")
+def do_slot(parser, token):
+    bits = token.split_contents()
+    if len(bits) != 2:
+        raise template.TemplateSyntaxError("The syntax for slot is {% slot name %}...{% endslot %}")
+
+    name = bits[1]
+    if name == "children":
+        raise template.TemplateSyntaxError("'children' can't be used as a slot name.")
+
+    # The tag being parsed is last on the command stack, and the tag it's directly inside of is before it
+    if len(parser.command_stack) < 2 or not parser.command_stack[-2][0].startswith("#"):
+        raise template.TemplateSyntaxError(f"The '{name}' slot must be placed directly inside a block component.")
+
+    nodelist = parser.parse(("endslot",))
+    parser.delete_first_token()
+
+    return SlotNode(name, nodelist)
 
 
 ##
@@ -0,0 +1,128 @@
+"""
+Nested component render tracing.
+
+Renders inside a `trace()` block record a tree of spans, one for each component render, nested the way the
+components were rendered. Traces can be exported to the Chrome trace event format, which can be opened in Perfetto
+or chrome://tracing.
+"""
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from time import perf_counter_ns
+from typing import Any, Dict, Iterator, List, Optional
+
+_tracer: ContextVar[Optional["Tracer"]] = ContextVar("slippers_tracer", default=None)
+_span: ContextVar[Optional["Span"]] = ContextVar("slippers_span", default=None)
+
+
+@dataclass
+class Span:
+    """A single component render. Times are from `perf_counter_ns`."""
+
+    name: str
+    template_path: str
+    origin_template_name: Optional[str]
+    origin_lineno: Optional[int]
+    start: int
+    thread_id: int
+    end: Optional[int] = None
+    children: List["Span"] = field(default_factory=list)
+
+    @property
+    def duration(self) -> float:
+        """Duration in seconds"""
+        return ((self.end or self.start) - self.start) / 1e9
+
+    def walk(self) -> Iterator["Span"]:
+        """Yield this span and all spans nested in it"""
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+
+class Tracer:
+    """Records a span tree for each top-level component render"""
+
+    def __init__(self):
+        self.start = perf_counter_ns()
+        self.roots: List[Span] = []
+
+    def start_span(self, node) -> Span:
+        span = Span(
+            name=node.tag_name.lstrip("#"),
+            template_path=node.template_path,
+            origin_template_name=node.origin_template_name,
+            origin_lineno=node.origin_lineno,
+            start=perf_counter_ns(),
+            thread_id=threading.get_ident(),
+        )
+
+        parent = _span.get()
+        (parent.children if parent is not None else self.roots).append(span)
+
+        return span
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Return the trace in the Chrome trace event format"""
+        pid = os.getpid()
+        events = [
+            {
+                "name": span.name,
+                "cat": "component",
+                "ph": "X",
+                "ts": (span.start - self.start) / 1000,
+                "dur": ((span.end or span.start) - span.start) / 1000,
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": {
+                    "template_path": span.template_path,
+                    "origin_template_name": span.origin_template_name,
+                    "origin_lineno": span.origin_lineno,
+                },
+            }
+            for root in self.roots
+            for span in root.walk()
+        ]
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export(self, path) -> None:
+        """Write the trace to a JSON file"""
+        with open(path, "w") as f:
+            json.dump(self.to_chrome_trace(), f)
+
+
+@contextmanager
+def trace() -> Iterator[Tracer]:
+    """Trace the component renders in this block, in the current thread or task"""
+    tracer = Tracer()
+    token = _tracer.set(tracer)
+    try:
+        yield tracer
+    finally:
+        _tracer.reset(token)
+
+
+def traced(render):
+    """Record a span around a component node's render method while tracing"""
+
+    @wraps(render)
+    def wrapper(node, *args, **kwargs):
+        tracer = _tracer.get()
+        if tracer is None:
+            return render(node, *args, **kwargs)
+
+        span = tracer.start_span(node)
+        token = _span.set(span)
+        try:
+            return render(node, *args, **kwargs)
+        finally:
+            span.end = perf_counter_ns()
+            _span.reset(token)
+
+    return wrapper
@@ -0,0 +1,80 @@
+import time
+
+from django.template import Context, Template
+from django.template.loader import render_to_string
+from django.test import RequestFactory, TestCase
+
+from slippers.asynchronous import arender_template
+
+
+class AsyncRenderTest(TestCase):
+    async def test_same_output_as_render(self):
+        request = RequestFactory().get("/report/")
+        context = {"user": "mixxorz", "name": "q", "rows": [("Ada", 3), ("Grace", 1)]}
+
+        expected = render_to_string("stream_page.html", context, request)
+
+        self.assertEqual(expected, await arender_template("stream_page.html", context, request))
+        self.assertInHTML(
+            "<table><tr><td>ADA</td><td>3</td><td></td></tr><tr><td>GRACE</td><td>1</td><td></td></tr></table>",
+            expected,
+        )
+
+    async def test_front_matter_awaits(self):
+        output = await arender_template(Template('{% async_greeting name="Ada" %}'))
+
+        self.assertEqual("\n<p>Hello, Ada</p>\n", output)
+
+    async def test_siblings_render_concurrently(self):
+        template = Template(
+            "{% for name in names %}{% async_greeting name=name delay=0.5 %}{% endfor %}"
+            "{% async_greeting for name in names name=name delay=0.5 %}"
+        )
+
+        start = time.perf_counter()
+        output = await arender_template(template, {"names": ["Ada", "Grace"]})
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual("\n<p>Hello, Ada</p>\n\n<p>Hello, Grace</p>\n" * 2, output)
+        self.assertLess(elapsed, 1.5)
+
+    async def test_nested_in_children(self):
+        template = Template(
+            '{% #card heading="Greetings" %}{% async_greeting name="Ada" %}{% /card %}{% avatar user="mixxorz" %}'
+        )
+
+        output = await arender_template(template)
+
+        self.assertIn("<p>Hello, Ada</p>", output)
+        self.assertIn('<div class="card__header">Greetings</div>', output)
+        self.assertIn("<div>I am avatar for mixxorz</div>", output)
+
+    async def test_context_resolved_before_deferring(self):
+        template = Template(
+            "{% for name in names %}{% with greeting=name|upper %}"
+            "{% async_greeting name=greeting %}{% endwith %}{% endfor %}"
+        )
+
+        output = await arender_template(template, {"names": ["Ada", "Grace"]})
+
+        self.assertEqual("\n<p>Hello, ADA</p>\n\n<p>Hello, GRACE</p>\n", output)
+
+    async def test_slots(self):
+        template = Template(
+            "{% #panel show_footer=True %}{% slot header %}{% async_greeting name=name %}{% endslot %}"
+            "{% slot footer %}{{ name }}{% endslot %}{% /panel %}"
+        )
+
+        output = await arender_template(template, {"name": "Ada"})
+
+        self.assertEqual("<section><header>\n<p>Hello, Ada</p>\n</header><footer>Ada</footer></section>\n", output)
+
+    def test_sync_render(self):
+        template = Template('{% async_greeting name="Ada" %}')
+
+        self.assertEqual("\n<p>Hello, Ada</p>\n", template.render(Context()))
+
+    async def test_component_assigned_to_variable(self):
+        template = Template('{% async_greeting name="Ada" as greeting %}[{{ greeting }}]')
+
+        self.assertEqual("[\n<p>Hello, Ada</p>\n]", await arender_template(template))
@@ -0,0 +1,87 @@
+from unittest.mock import patch
+
+from django.template import Context, Template
+from django.test import TestCase, override_settings
+from django.utils.safestring import mark_safe
+
+from slippers.cache import ComponentCache, freeze, get_component_cache, make_cache_key
+
+
+class PureComponentTest(TestCase):
+    def setUp(self):
+        get_component_cache().clear()
+
+    @override_settings(SLIPPERS_RUNTIME_TYPE_CHECKING=True)
+    def test_output_cached(self):
+        template = Template("{% #pure_component variant=variant %}Hello{% /pure_component %}")
+
+        with patch("slippers.templatetags.slippers.check_prop_types", return_value=[]) as mock_check_prop_types:
+            first = template.render(Context({"variant": "primary"}))
+            second = template.render(Context({"variant": "primary"}))
+
+        self.assertHTMLEqual('<span class="primary">Hello</span>', first)
+        self.assertEqual(first, second)
+        self.assertEqual(1, mock_check_prop_types.call_count)
+        self.assertEqual({"hits": 1, "misses": 1, "evictions": 0, "size": 1}, get_component_cache().stats())
+
+    def test_key_depends_on_props_and_children(self):
+        template = Template("{% #pure_component variant=variant %}{{ label }}{% /pure_component %}")
+
+        outputs = [
+            template.render(Context({"variant": "primary", "label": "One"})),
+            template.render(Context({"variant": "secondary", "label": "One"})),
+            template.render(Context({"variant": "primary", "label": "Two"})),
+        ]
+
+        self.assertEqual(3, len(set(outputs)))
+        self.assertEqual(3, get_component_cache().stats()["misses"])
+
+    def test_uncacheable_props_render_normally(self):
+        template = Template("{% pure_component variant=variant %}")
+
+        output = template.render(Context({"variant": object()}))
+
+        self.assertIn("<span", output)
+        self.assertEqual({"hits": 0, "misses": 0, "evictions": 0, "size": 0}, get_component_cache().stats())
+
+    @override_settings(
+        SLIPPERS_COMPONENT_CACHE="components",
+        CACHES={"components": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+    )
+    def test_django_cache_backend(self):
+        template = Template('{% pure_component variant="primary" %}')
+
+        template.render(Context())
+        template.render(Context())
+
+        self.assertEqual({"hits": 1, "misses": 1, "evictions": 0}, get_component_cache().stats())
+
+
+class ComponentCacheTest(TestCase):
+    def test_evicts_least_recently_used(self):
+        cache = ComponentCache(max_size=2)
+
+        cache.set("a", "A")
+        cache.set("b", "B")
+        cache.get("a")
+        cache.set("c", "C")
+
+        self.assertEqual("A", cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(1, cache.stats()["evictions"])
+
+    def test_freeze(self):
+        self.assertNotEqual(freeze("<b>"), freeze(mark_safe("<b>")))
+        self.assertEqual(freeze({"a": [1, 2]}), freeze({"a": [1, 2]}))
+
+        with self.assertRaises(TypeError):
+            freeze({"a": object()})
+
+    def test_key_depends_on_language(self):
+        with self.settings(LANGUAGE_CODE="en"):
+            english = make_cache_key("icon.html", "abc", {}, "", True)
+
+        with self.settings(LANGUAGE_CODE="fr"):
+            french = make_cache_key("icon.html", "abc", {}, "", True)
+
+        self.assertNotEqual(english, french)
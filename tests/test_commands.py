@@ -0,0 +1,138 @@
+import json
+import marshal
+import os
+import tempfile
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import CommandError, call_command
+from django.template import TemplateDoesNotExist
+from django.test import TestCase
+
+from slippers.apps import load_compiled_components
+from slippers.build import load_build
+from slippers.props import _front_matter_cache
+
+
+class SlippersCompileTest(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.output = os.path.join(directory.name, "components.bin")
+
+    def test_compiles_registered_components(self):
+        stdout = StringIO()
+
+        call_command("slippers_compile", output=self.output, stdout=stdout)
+
+        self.assertIn("front matter blocks", stdout.getvalue())
+
+        _front_matter_cache.clear()
+        self.assertGreater(load_build(self.output), 0)
+        self.assertTrue(any(origin.endswith("component_code.html") for origin in _front_matter_cache))
+
+    @patch("slippers.management.commands.slippers_compile.get_components")
+    def test_front_matter_syntax_error(self, mock_get_components):
+        mock_get_components.return_value = {"broken": "invalid_front_matter.html"}
+
+        with self.assertRaisesMessage(CommandError, "broken: invalid front matter"):
+            call_command("slippers_compile", output=self.output)
+
+        self.assertFalse(os.path.exists(self.output))
+
+    @patch("slippers.management.commands.slippers_compile.get_components")
+    def test_missing_template(self, mock_get_components):
+        mock_get_components.return_value = {"missing": "does_not_exist.html"}
+
+        with self.assertRaisesMessage(CommandError, "missing: template 'does_not_exist.html' does not exist"):
+            call_command("slippers_compile", output=self.output)
+
+    @patch("slippers.management.commands.slippers_compile.get_components")
+    def test_missing_components_yaml(self, mock_get_components):
+        mock_get_components.side_effect = TemplateDoesNotExist("components.yaml")
+
+        with self.assertRaisesMessage(CommandError, "No components.yaml found"):
+            call_command("slippers_compile", output=self.output)
+
+    def test_build_from_another_python_version(self):
+        with open(self.output, "wb") as f:
+            marshal.dump({"cache_tag": "cpython-00", "front_matter": {}}, f)
+
+        self.assertIsNone(load_build(self.output))
+
+        with self.settings(SLIPPERS_COMPILED_COMPONENTS=self.output):
+            with self.assertLogs("slippers", level="WARNING") as logs:
+                load_compiled_components()
+
+        self.assertIn("compiled by another version of Python", logs.output[0])
+
+    def test_corrupt_build(self):
+        call_command("slippers_compile", output=self.output, stdout=StringIO())
+        with open(self.output, "rb") as f:
+            data = f.read()
+
+        for content in [data[: len(data) // 2], b"\xff" + data]:
+            with self.subTest(content=content[:8]):
+                with open(self.output, "wb") as f:
+                    f.write(content)
+
+                with self.settings(SLIPPERS_COMPILED_COMPONENTS=self.output):
+                    with self.assertLogs("slippers", level="WARNING") as logs:
+                        load_compiled_components()
+
+                self.assertIn("couldn't be read", logs.output[0])
+
+
+class SlippersBenchTest(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def write(self, name, content):
+        path = os.path.join(self.directory, name)
+        with open(path, "w") as f:
+            f.write(content)
+        return path
+
+    def test_template(self):
+        stdout = StringIO()
+        context = self.write("context.json", json.dumps({"user": "mixxorz"}))
+
+        call_command("slippers_bench", "profile_card.html", context=context, iterations=20, stdout=stdout)
+
+        output = stdout.getvalue()
+        self.assertIn("Rendered profile_card.html 20 times", output)
+        self.assertRegex(output, r"Latency: p50 [\d.]+ms  p95 [\d.]+ms  p99 [\d.]+ms")
+        self.assertIn("Peak memory per render", output)
+        self.assertRegex(output, r"avatar\s+[\d.]+%")
+
+    def test_component_with_threads(self):
+        props = self.write("props.yaml", "heading: Hello\nchildren: <p>Body</p>\n")
+        results_path = os.path.join(self.directory, "results.json")
+
+        call_command(
+            "slippers_bench",
+            component="card",
+            context=props,
+            iterations=10,
+            threads=2,
+            output=results_path,
+            stdout=StringIO(),
+        )
+
+        with open(results_path) as f:
+            results = json.load(f)
+
+        self.assertEqual("card", results["target"])
+        self.assertEqual(2, results["threads"])
+        self.assertLessEqual(results["p50"], results["p99"])
+        self.assertIn("card", results["components"])
+
+    def test_requires_one_target(self):
+        with self.assertRaisesMessage(CommandError, "Pass either a template name or --component."):
+            call_command("slippers_bench")
+
+    def test_unknown_component(self):
+        with self.assertRaisesMessage(CommandError, "No component named 'missing' has been registered."):
+            call_command("slippers_bench", component="missing")
@@ -0,0 +1,202 @@
+from pathlib import Path
+from unittest.mock import patch
+
+from django.conf import settings as django_settings
+from django.template import Context, Engine, Template
+from django.test import TestCase, override_settings
+
+from slippers.apps import changed, get_components, register_tags, warm_up_components
+from slippers.components import extract_template_parts, get_component_template, tag_dependents
+from slippers.props import _prop_validators
+from slippers.templatetags.slippers import component_registry
+
+
+class ComponentTemplateTest(TestCase):
+    def setUp(self):
+        self.engine = Engine(dirs=django_settings.TEMPLATES[0]["DIRS"], debug=True)
+
+    def test_splits_front_matter(self):
+        template = self.engine.from_string("---\nprops.types = {'name': str}\n---\n<p>{{ name }}</p>")
+
+        component = get_component_template(template)
+
+        self.assertEqual("props.types = {'name': str}", component.front_matter)
+        self.assertEqual("\n<p>Ada</p>", component.body.render(Context({"name": "Ada"})))
+
+    def test_without_front_matter(self):
+        template = self.engine.from_string("<p>{{ name }}</p>")
+
+        component = get_component_template(template)
+
+        self.assertEqual("", component.front_matter)
+        self.assertIs(template, component.body)
+
+    def test_stored_on_template(self):
+        template = self.engine.get_template("component_code.html")
+
+        self.assertIs(get_component_template(template), get_component_template(template))
+
+    def test_matches_rendered_output_split(self):
+        sources = [
+            "---\nprops.types = {}\n---\n<b>{{ x }}</b>{% if x %}y{% endif %}\n",
+            "---\n---\nempty front matter",
+            "---\nonly an opening delimiter {{ x }}",
+            "---\nprops['a'] = '{{ x }}'\n---\n{{ x }}",
+            "---\nx = 1\n---\n{{ x }}\n---\nhorizontal rule",
+        ]
+
+        for source in sources:
+            with self.subTest(source=source):
+                template = self.engine.from_string(source)
+
+                expected = extract_template_parts(template.render(Context({"x": 1})))[1]
+                actual = get_component_template(template).body.render(Context({"x": 1}))
+
+                self.assertEqual(expected, actual)
+
+
+class LoaderTest(TestCase):
+    def test_splits_components_at_load_time(self):
+        engine = Engine(
+            dirs=django_settings.TEMPLATES[0]["DIRS"],
+            loaders=[("slippers.loaders.Loader", ["django.template.loaders.filesystem.Loader"])],
+        )
+
+        template = engine.get_template("component_code.html")
+
+        self.assertIn("props.types", template.slippers_component.front_matter)
+        self.assertIs(template, engine.get_template("component_code.html"))
+
+
+class ComponentNodeTemplateTest(TestCase):
+    def render_twice(self, template, on_between=None):
+        engine = Engine.get_default()
+
+        with patch.object(engine, "get_template", wraps=engine.get_template) as get_template:
+            template.render(Context())
+            if on_between:
+                on_between()
+            template.render(Context())
+
+        return get_template.call_count
+
+    def test_template_resolved_once(self):
+        template = Template('{% avatar user="mixxorz" %}')
+
+        self.assertEqual(1, self.render_twice(template))
+
+    def test_template_file_change_invalidates(self):
+        template = Template('{% avatar user="mixxorz" %}')
+
+        def on_between():
+            changed(sender=None, file_path=Path(django_settings.TEMPLATES[0]["DIRS"][0]) / "avatar.html")
+
+        self.assertEqual(2, self.render_twice(template, on_between))
+
+    def test_python_file_change_does_not_invalidate(self):
+        template = Template('{% avatar user="mixxorz" %}')
+
+        def on_between():
+            changed(sender=None, file_path=Path(__file__))
+
+        self.assertEqual(1, self.render_twice(template, on_between))
+
+
+@override_settings(SLIPPERS_FINE_GRAINED_RELOAD=True)
+class FineGrainedReloadTest(TestCase):
+    def setUp(self):
+        self.engine = Engine.get_default()
+        for loader in self.engine.template_loaders:
+            loader.reset()
+
+        self.templates_dir = Path(django_settings.TEMPLATES[0]["DIRS"][0])
+
+    def test_records_templates_using_component_tags(self):
+        self.engine.get_template("profile_card.html")
+
+        self.assertIn(str(self.templates_dir / "profile_card.html"), tag_dependents["card"])
+        self.assertIn(str(self.templates_dir / "profile_card.html"), tag_dependents["avatar"])
+
+    def test_template_change_evicts_only_that_template(self):
+        profile_card = self.engine.get_template("profile_card.html")
+        avatar = self.engine.get_template("avatar.html")
+
+        self.assertTrue(changed(sender=None, file_path=self.templates_dir / "avatar.html"))
+
+        self.assertIs(profile_card, self.engine.get_template("profile_card.html"))
+        self.assertIsNot(avatar, self.engine.get_template("avatar.html"))
+
+    def test_component_change_is_picked_up_by_dependents(self):
+        template = Template('{% avatar user="mixxorz" %}')
+        template.render(Context())
+
+        with patch.object(self.engine, "get_template", wraps=self.engine.get_template) as get_template:
+            changed(sender=None, file_path=self.templates_dir / "avatar.html")
+            template.render(Context())
+
+        self.assertEqual(1, get_template.call_count)
+
+    def test_components_yaml_change_evicts_templates_using_changed_tags(self):
+        self.addCleanup(register_tags)
+        profile_card = self.engine.get_template("profile_card.html")
+        button = self.engine.get_template("button.html")
+
+        with patch("slippers.apps.get_components", return_value={**get_components(), "avatar": "card.html"}):
+            changed(sender=None, file_path=self.templates_dir / "components.yaml")
+
+        self.assertIsNot(profile_card, self.engine.get_template("profile_card.html"))
+        self.assertIs(button, self.engine.get_template("button.html"))
+
+    def test_components_yaml_change_forgets_removed_components(self):
+        self.addCleanup(register_tags)
+        components = get_components()
+        del components["avatar"]
+
+        with patch("slippers.apps.get_components", return_value=components):
+            changed(sender=None, file_path=self.templates_dir / "components.yaml")
+
+        self.assertNotIn("avatar", component_registry)
+        self.assertIn("button", component_registry)
+
+    def test_other_files_are_not_handled(self):
+        self.assertFalse(changed(sender=None, file_path=Path("/tmp/notes.txt")))
+
+
+class WarmUpTest(TestCase):
+    @patch("slippers.apps.gc.freeze")
+    def test_loads_registered_components(self, mock_freeze):
+        engine = Engine.get_default()
+        for loader in engine.template_loaders:
+            loader.reset()
+
+        with self.assertLogs("slippers", level="INFO") as logs, self.settings(SLIPPERS_WARMUP_FREEZE_GC=True):
+            warm_up_components()
+
+        self.assertRegex(logs.output[-1], r"Warmed up \d+ component templates in [\d.]+ms")
+        self.assertTrue(mock_freeze.called)
+
+        cached_loader = engine.template_loaders[0]
+        self.assertIn("component_code.html", cached_loader.get_template_cache)
+        self.assertIn(
+            "props.types", cached_loader.get_template_cache["component_code.html"].slippers_component.front_matter
+        )
+
+    @override_settings(SLIPPERS_RUNTIME_TYPE_CHECKING=True)
+    def test_builds_prop_validators_used_when_rendering(self):
+        engine = Engine.get_default()
+        for loader in engine.template_loaders:
+            loader.reset()
+        _prop_validators.clear()
+
+        warm_up_components()
+
+        template = engine.get_template("type_checking.html")
+        key = (template.origin.name, template.slippers_component.fingerprint)
+        self.assertIn(key, _prop_validators)
+
+        validators = dict(_prop_validators)
+        Template('{% type_checking string="Hi" number=1 list_of_numbers=numbers string_or_number=1 %}').render(
+            Context({"numbers": [1, 2]})
+        )
+
+        self.assertEqual(validators, _prop_validators)
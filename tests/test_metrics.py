@@ -0,0 +1,88 @@
+from unittest.mock import Mock, patch
+
+from django.template import Context, Template
+from django.test import TestCase, override_settings
+
+from slippers.metrics import PHASES, ComponentRender, StatsdSink, aggregator, component_rendered, start_timer
+
+
+@override_settings(SLIPPERS_METRICS=["slippers.metrics.aggregator", "slippers.metrics.send_signal"])
+class MetricsTest(TestCase):
+    def setUp(self):
+        aggregator.reset()
+
+    def test_aggregates_renders_by_tag(self):
+        template = Template('{% #card heading="Hi" %}{% avatar user="mixxorz" %}{% /card %}')
+
+        output = template.render(Context())
+        template.render(Context())
+
+        snapshot = aggregator.snapshot()
+        self.assertEqual({"avatar", "card"}, snapshot.keys())
+        self.assertEqual(2, snapshot["card"]["count"])
+        self.assertEqual(len(output) * 2, snapshot["card"]["size"])
+        self.assertGreater(snapshot["card"]["total"], 0)
+        self.assertEqual({"count", "size", "total", *PHASES}, snapshot["card"].keys())
+
+    def test_loop_renders_recorded_per_item(self):
+        template = Template("{% table_row for row in rows name=row.0 score=row.1 %}")
+
+        template.render(Context({"rows": [("Ada", 1), ("Grace", 2), ("Alan", 3)]}))
+
+        self.assertEqual(3, aggregator.snapshot()["table_row"]["count"])
+
+    def test_signal(self):
+        renders = []
+
+        def receiver(sender, render, **kwargs):
+            renders.append(render)
+
+        component_rendered.connect(receiver)
+        self.addCleanup(component_rendered.disconnect, receiver)
+
+        Template('{% avatar user="mixxorz" %}').render(Context())
+
+        self.assertEqual(1, len(renders))
+        self.assertEqual("avatar", renders[0].tag_name)
+        self.assertEqual("avatar.html", renders[0].template_path)
+        self.assertEqual(set(PHASES), renders[0].timings.keys())
+
+    def test_snapshot_is_a_copy(self):
+        Template('{% avatar user="mixxorz" %}').render(Context())
+
+        aggregator.snapshot()["avatar"]["count"] = 100
+
+        self.assertEqual(1, aggregator.snapshot()["avatar"]["count"])
+
+
+class MetricsOffTest(TestCase):
+    def test_no_timer(self):
+        self.assertIsNone(start_timer())
+
+    @patch("slippers.metrics.record")
+    def test_nothing_recorded(self, mock_record):
+        Template('{% avatar user="mixxorz" %}').render(Context())
+
+        self.assertFalse(mock_record.called)
+
+
+class StatsdSinkTest(TestCase):
+    def test_reports_to_client(self):
+        client = Mock()
+        sink = StatsdSink(client)
+
+        sink(
+            ComponentRender(
+                tag_name="card",
+                template_path="card.html",
+                origin_template_name=None,
+                origin_lineno=None,
+                timings={"resolve": 0.001, "render": 0.002},
+                size=120,
+            )
+        )
+
+        client.incr.assert_any_call("slippers.card.count")
+        client.incr.assert_any_call("slippers.card.size", 120)
+        client.timing.assert_any_call("slippers.card.resolve", 1.0)
+        client.timing.assert_any_call("slippers.card.render", 2.0)
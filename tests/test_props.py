@@ -0,0 +1,151 @@
+from enum import Enum
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
+
+from django.test import TestCase
+from django.utils.safestring import SafeString
+from typeguard import check_type
+
+from slippers.props import (
+    PropError,
+    Props,
+    check_prop_types,
+    compile_front_matter,
+    compile_type_check,
+    get_prop_validator,
+)
+
+
+class CompileFrontMatterTest(TestCase):
+    def test_reuses_code_for_same_origin(self):
+        code = "props['answer'] = 42"
+
+        first = compile_front_matter(code, "/components/reuse.html")
+        second = compile_front_matter(code, "/components/reuse.html")
+
+        self.assertIs(first, second)
+
+    def test_recompiles_when_source_changes(self):
+        first = compile_front_matter("props['answer'] = 42", "/components/changed.html")
+        second = compile_front_matter("props['answer'] = 43", "/components/changed.html")
+
+        self.assertIsNot(first, second)
+
+        props = Props.from_string({}, "props['answer'] = 43", "/components/changed.html")
+        self.assertEqual(43, props["answer"])
+
+    def test_typing_names_available(self):
+        props = Props.from_string({}, "props.types = {'items': List[Optional[int]]}")
+
+        self.assertEqual({"items": List[Optional[int]]}, props.types)
+
+
+class Color(Enum):
+    RED = "red"
+
+
+class CompileTypeCheckTest(TestCase):
+    def test_matches_typeguard(self):
+        types = [
+            str,
+            int,
+            bool,
+            float,
+            list,
+            dict,
+            Any,
+            Optional[str],
+            Union[str, int],
+            List[int],
+            List[Any],
+            List[Optional[str]],
+            Dict[str, int],
+            Dict[str, Any],
+            Literal["primary", "secondary"],
+            Literal[1, True, None],
+            Literal[Color.RED],
+            Tuple[int, str],
+        ]
+        values = [
+            "text",
+            SafeString("safe"),
+            0,
+            1,
+            True,
+            1.5,
+            None,
+            [],
+            [1, 2],
+            [1, "two"],
+            ["a", None],
+            {},
+            {"a": 1},
+            {"a": "b"},
+            {1: 1},
+            "primary",
+            Color.RED,
+            (1, "a"),
+        ]
+
+        for expected in types:
+            check = compile_type_check(expected)
+
+            for value in values:
+                with self.subTest(expected=expected, value=value):
+                    try:
+                        check_type("prop", value, expected)
+                    except TypeError:
+                        valid = False
+                    else:
+                        valid = True
+
+                    self.assertEqual(valid, check(value))
+
+
+class PropValidatorTest(TestCase):
+    def test_errors_in_order(self):
+        types = {"title": str, "count": int, "size": Optional[int], "variant": str}
+        attributes = {"extra": 1, "count": "1", "title": 2}
+
+        errors = check_prop_types(attributes=attributes, types=types, defaults={"variant": "primary"})
+
+        self.assertEqual(
+            [
+                PropError(error="invalid", name="count", expected=int, actual=str),
+                PropError(error="invalid", name="title", expected=str, actual=int),
+                PropError(error="extra", name="extra", expected=None, actual=int),
+            ],
+            errors,
+        )
+
+        errors = check_prop_types(attributes={}, types=types, defaults={})
+
+        self.assertEqual(
+            [
+                PropError(error="missing", name="title", expected=str, actual=None),
+                PropError(error="missing", name="count", expected=int, actual=None),
+                PropError(error="missing", name="variant", expected=str, actual=None),
+            ],
+            errors,
+        )
+
+    def test_validator_cached(self):
+        first = get_prop_validator({"items": List[int]}, {})
+        second = get_prop_validator({"items": List[int]}, {})
+
+        self.assertIs(first, second)
+
+    def test_validator_cached_by_key(self):
+        first = get_prop_validator({"variant": Literal["primary", "secondary"]}, {}, key=("button.html", "abc"))
+
+        # Fill typing's cache of parameterized generics, so the same type is evaluated into a new object
+        for i in range(300):
+            Literal[f"variant {i}"]
+
+        types = {"variant": Literal["primary", "secondary"]}
+        self.assertIsNot(first.types["variant"], types["variant"])
+        self.assertIs(first, get_prop_validator(types, {}, key=("button.html", "abc")))
+
+        # Changed types replace the cached validator
+        changed = get_prop_validator({"variant": Literal["primary"]}, {}, key=("button.html", "abc"))
+        self.assertIsNot(first, changed)
+        self.assertEqual(("variant",), changed.required)
@@ -0,0 +1,64 @@
+from unittest.mock import patch
+
+from django.http import StreamingHttpResponse
+from django.template import Context, Template
+from django.template.loader import get_template, render_to_string
+from django.test import RequestFactory, TestCase
+
+from slippers.streaming import stream_template
+from slippers.templatetags.slippers import ComponentNode
+
+
+class StreamTemplateTest(TestCase):
+    def setUp(self):
+        self.request = RequestFactory().get("/report/")
+        self.context = {"user": "mixxorz", "name": "q", "rows": [("Ada", 3), ("Grace", 1)]}
+
+    def test_same_output_as_render(self):
+        expected = render_to_string("stream_page.html", self.context, self.request)
+
+        self.assertEqual(expected, "".join(stream_template("stream_page.html", self.context, self.request)))
+        self.assertIn("<title>Report - Base</title>", expected)
+        self.assertIn("/report/", expected)
+        self.assertInHTML(
+            "<table><tr><td>ADA</td><td>3</td><td></td></tr><tr><td>GRACE</td><td>1</td><td></td></tr></table>",
+            expected,
+        )
+
+    def test_empty_loop(self):
+        context = {**self.context, "rows": []}
+
+        self.assertEqual(
+            render_to_string("stream_page.html", context), "".join(stream_template("stream_page.html", context))
+        )
+
+    def test_split_around_components(self):
+        template = Template('<h1>Head</h1>{% avatar user="mixxorz" %}<p>Tail</p>')
+
+        chunks = list(stream_template(template))
+
+        self.assertEqual(["<h1>Head</h1>", "<div>I am avatar for mixxorz</div>\n", "<p>Tail</p>"], chunks)
+
+    def test_output_sent_before_components_render(self):
+        template = Template('<h1>Head</h1>{% avatar user="mixxorz" %}')
+
+        with patch.object(ComponentNode, "check_props", autospec=True, side_effect=ComponentNode.check_props) as mock:
+            chunks = stream_template(template)
+
+            self.assertEqual("<h1>Head</h1>", next(chunks))
+            self.assertFalse(mock.called)
+
+            list(chunks)
+            self.assertTrue(mock.called)
+
+    def test_component_assigned_to_variable(self):
+        template = Template('{% avatar user="mixxorz" as avatar %}<p>{{ avatar }}</p>')
+
+        self.assertEqual(template.render(Context()), "".join(stream_template(template)))
+
+    def test_streaming_response(self):
+        response = StreamingHttpResponse(stream_template(get_template("stream_page.html"), self.context))
+
+        content = b"".join(response.streaming_content).decode()
+
+        self.assertEqual(render_to_string("stream_page.html", self.context), content)
@@ -1,10 +1,19 @@
+import copy
+import warnings
 from unittest.mock import patch
 
 from django.conf import settings as django_settings
-from django.template import Context, RequestContext, Template, TemplateSyntaxError
+from django.template import Context, Library, RequestContext, Template, TemplateSyntaxError
 from django.test import RequestFactory, TestCase, override_settings
+from django.utils.safestring import mark_safe
 from typeguard import get_type_name
 
+from slippers import render_component
+from slippers.components import reset_component_templates
+from slippers.lazy import LazyRender
+from slippers.props import PropValidator
+from slippers.templatetags.slippers import ComponentNode, parse_match_mapping, register_components
+
 
 class ComponentTest(TestCase):
     def test_render_inline_component(self):
@@ -133,6 +142,375 @@ class ComponentTest(TestCase):
         self.assertHTMLEqual(expected, Template(template).render(Context()))
 
 
+class ComponentLoopTest(TestCase):
+    def test_inline_loop(self):
+        template = """
+            <table>{% table_row for row in rows name=row.name score=row.score %}</table>
+        """
+
+        expected = """
+            <table>
+                <tr><td>ADA</td><td>10</td><td></td></tr>
+                <tr><td>GRACE</td><td>20</td><td></td></tr>
+            </table>
+        """
+
+        context = Context({"rows": [{"name": "ada", "score": 10}, {"name": "grace", "score": 20}]})
+
+        self.assertHTMLEqual(expected, Template(template).render(context))
+
+    def test_block_loop_with_unpacking(self):
+        template = """
+            {% #table_row for name,score in rows name=name score=score %}{{ name }}{% /table_row %}
+        """
+
+        expected = """
+            <tr><td>ADA</td><td>10</td><td>ada</td></tr>
+            <tr><td>GRACE</td><td>20</td><td>grace</td></tr>
+        """
+
+        context = Context({"rows": [("ada", 10), ("grace", 20)]})
+
+        self.assertHTMLEqual(expected, Template(template).render(context))
+
+    def test_loop_with_spaced_unpacking(self):
+        template = """
+            {% table_row for name, score in rows name=name score=score %}
+            {% table_row for name , score in rows name=name score=score %}
+        """
+
+        expected = """
+            <tr><td>ADA</td><td>10</td><td></td></tr>
+            <tr><td>GRACE</td><td>20</td><td></td></tr>
+            <tr><td>ADA</td><td>10</td><td></td></tr>
+            <tr><td>GRACE</td><td>20</td><td></td></tr>
+        """
+
+        context = Context({"rows": [("ada", 10), ("grace", 20)]})
+
+        self.assertHTMLEqual(expected, Template(template).render(context))
+
+    def test_malformed_loop(self):
+        for source in [
+            "{% table_row for row rows name=row %}",
+            "{% table_row for in rows name=row %}",
+            "{% table_row for row in %}",
+            "{% table_row for name, in rows name=name %}",
+            "{% table_row for name=name in rows %}",
+        ]:
+            with self.subTest(source=source):
+                with self.assertRaises(TemplateSyntaxError):
+                    Template(source)
+
+    def test_loop_vars_do_not_leak(self):
+        template = """{% table_row for name in names name=name score=1 %}{{ name }}"""
+
+        output = Template(template).render(Context({"names": ["ada"], "name": "outer"}))
+
+        self.assertTrue(output.endswith("outer"))
+
+    def test_empty_sequence_as_variable(self):
+        template = """{% table_row for row in rows name=row score=1 as rendered %}[{{ rendered }}]"""
+
+        self.assertEqual("[]", Template(template).render(Context({"rows": []})))
+
+    @override_settings(SLIPPERS_RUNTIME_TYPE_CHECKING=True)
+    @patch("slippers.templatetags.slippers.render_error_html")
+    def test_props_checked_per_item(self, mock_render_error_html):
+        mock_render_error_html.return_value = ""
+
+        template = """{% table_row for row in rows name=row score=1 %}"""
+
+        Template(template).render(Context({"rows": ["ada", 2]}))
+
+        self.assertEqual(1, mock_render_error_html.call_count)
+        self.assertEqual("name", mock_render_error_html.call_args[1]["errors"][0].name)
+
+
+class RenderComponentTest(TestCase):
+    def test_inline(self):
+        self.assertHTMLEqual("<div>I am avatar for mixxorz</div>", render_component("avatar", user="mixxorz"))
+
+    def test_children(self):
+        self.assertHTMLEqual(
+            "<button>I am <b>button</b></button>",
+            render_component("button", children=mark_safe("I am <b>button</b>")),
+        )
+        self.assertHTMLEqual(
+            "<button>&lt;b&gt;</button>",
+            render_component("button", children="<b>"),
+        )
+
+    def test_front_matter_defaults(self):
+        output = render_component("component_code", required_string="Hello, World")
+
+        self.assertIn("Default number: 10", output)
+        self.assertIn("New number: 20", output)
+
+    @override_settings(SLIPPERS_RUNTIME_TYPE_CHECKING=True)
+    @patch("slippers.templatetags.slippers.render_error_html")
+    def test_prop_checking(self, mock_render_error_html):
+        mock_render_error_html.return_value = ""
+
+        render_component("component_code", required_string=10)
+
+        errors = mock_render_error_html.call_args[1]["errors"]
+        self.assertEqual([("invalid", "required_string")], [(error.error, error.name) for error in errors])
+
+    def test_unknown_component(self):
+        with self.assertRaises(KeyError):
+            render_component("not_a_component")
+
+    def test_other_library_not_rendered(self):
+        register_components({"avatar": "button.html"}, Library())
+
+        self.assertHTMLEqual("<div>I am avatar for mixxorz</div>", render_component("avatar", user="mixxorz"))
+
+
+class DedupeTest(TestCase):
+    def test_identical_renders_deduplicated(self):
+        template = Template(
+            """
+            {% for i in "123" %}{% deduped_avatar user="mixxorz" %}{% endfor %}
+            {% #card heading="Heading" %}{% deduped_avatar user="mixxorz" %}{% /card %}
+            {% deduped_avatar user="someone else" %}
+            """
+        )
+
+        with patch.object(
+            ComponentNode, "render_component", autospec=True, side_effect=ComponentNode.render_component
+        ) as mock_render_component:
+            output = template.render(Context())
+
+        # One render for card, and one for each distinct avatar
+        self.assertEqual(3, mock_render_component.call_count)
+        self.assertEqual(4, output.count("I am avatar for mixxorz"))
+        self.assertIn("I am avatar for someone else", output)
+
+    def test_memo_scoped_to_render(self):
+        template = Template('{% deduped_avatar user="mixxorz" %}')
+
+        with patch.object(
+            ComponentNode, "render_component", autospec=True, side_effect=ComponentNode.render_component
+        ) as mock_render_component:
+            template.render(Context())
+            template.render(Context())
+
+        self.assertEqual(2, mock_render_component.call_count)
+
+    def test_memo_scoped_to_render_of_same_context(self):
+        template = Template('{% deduped_avatar user="mixxorz" %}{% deduped_avatar user="mixxorz" %}')
+        context = Context()
+
+        with patch.object(
+            ComponentNode, "render_component", autospec=True, side_effect=ComponentNode.render_component
+        ) as mock_render_component:
+            template.render(context)
+            template.render(context)
+
+        self.assertEqual(2, mock_render_component.call_count)
+
+
+class LazyChildrenTest(TestCase):
+    def setUp(self):
+        self.loads = 0
+
+    def load(self):
+        self.loads += 1
+        return "<b>Secret</b>"
+
+    def test_children_not_rendered_unless_output(self):
+        template = Template("{% #permission_gate allowed=allowed %}<p>{{ load|safe }}</p>{% /permission_gate %}")
+
+        self.assertEqual("\n", template.render(Context({"allowed": False, "load": self.load})))
+        self.assertEqual(0, self.loads)
+
+        self.assertEqual(
+            '<div class="gate"><p><b>Secret</b></p></div>\n',
+            template.render(Context({"allowed": True, "load": self.load})),
+        )
+        self.assertEqual(1, self.loads)
+
+    def test_children_rendered_in_parent_context(self):
+        template = Template(
+            "{% for name in names %}{% #permission_gate allowed=True %}{{ name }}{% /permission_gate %}{% endfor %}"
+        )
+
+        self.assertHTMLEqual(
+            '<div class="gate">&lt;b&gt;Ada</div><div class="gate">Grace</div>',
+            template.render(Context({"names": ["<b>Ada", "Grace"]})),
+        )
+
+    def test_children_used_like_a_string(self):
+        template = Template("{% #children_probe %}{{ text }}{% /children_probe %}")
+
+        self.assertEqual("has|a|[a][b]|b\n", template.render(Context({"text": "ab"})))
+        self.assertEqual("| |[ ]|\n", template.render(Context({"text": " "})))
+
+    def test_copied_without_rendering(self):
+        template = Template("{{ load }}")
+        children = LazyRender(template.nodelist, Context({"load": self.load}))
+
+        copy.copy(children)
+        copy.deepcopy(children)
+
+        self.assertEqual(0, self.loads)
+
+    def test_rendered_at_most_once(self):
+        template = Template("{{ load|safe }}")
+        context = Context({"load": self.load})
+
+        with context.bind_template(template):
+            children = LazyRender(template.nodelist, context)
+
+            self.assertEqual("<b>Secret</b>", str(children))
+            self.assertTrue(children)
+            self.assertEqual(13, len(children))
+            self.assertEqual("<b>Secret</b>", children)
+
+        self.assertEqual(1, self.loads)
+
+    def test_output_not_escaped_again(self):
+        template = Template("<b>{{ name }}</b>")
+        context = Context({"name": "<i>"})
+
+        with context.bind_template(template):
+            children = LazyRender(template.nodelist, context)
+
+            self.assertEqual("<b>&lt;i&gt;</b>", Template("{{ children }}").render(Context({"children": children})))
+
+    def test_safe_filters_match_eager_children(self):
+        template = Template("<b>{{ name }}</b>")
+        context = Context({"name": "<i>"})
+
+        for source in ['{{ children|slice:":9" }}', "{{ children|first }}"]:
+            with self.subTest(source=source), context.bind_template(template):
+                children = LazyRender(template.nodelist, context)
+                usage = Template(source)
+
+                self.assertEqual(
+                    usage.render(Context({"children": mark_safe("<b>&lt;i&gt;</b>")})),
+                    usage.render(Context({"children": children})),
+                )
+
+
+class SlotTest(TestCase):
+    def setUp(self):
+        self.loads = 0
+
+    def load(self):
+        self.loads += 1
+        return "Footer"
+
+    def test_slots_rendered_in_component(self):
+        template = Template(
+            "{% #panel show_footer=True %}"
+            "{% slot header %}<h2>{{ title }}</h2>{% endslot %}"
+            "<p>Body</p>"
+            "{% slot footer %}{{ load }}{% endslot %}"
+            "{% /panel %}"
+        )
+
+        self.assertHTMLEqual(
+            "<section><header><h2>&lt;Title&gt;</h2></header><p>Body</p><footer>Footer</footer></section>",
+            template.render(Context({"title": "<Title>", "load": self.load})),
+        )
+
+    def test_unused_slots_not_rendered(self):
+        template = Template("{% #panel %}<p>Body</p>{% slot footer %}{{ load }}{% endslot %}{% /panel %}")
+
+        self.assertHTMLEqual("<section><p>Body</p></section>", template.render(Context({"load": self.load})))
+        self.assertEqual(0, self.loads)
+
+    def test_slots_in_loop(self):
+        template = Template("{% #panel for name in names %}{% slot header %}{{ name }}{% endslot %}{% /panel %}")
+
+        self.assertHTMLEqual(
+            "<section><header>Ada</header></section><section><header>Grace</header></section>",
+            template.render(Context({"names": ["Ada", "Grace"]})),
+        )
+
+    def test_blocks_in_slots(self):
+        template = Template('{% extends "slot_base.html" %}{% block heading %}Child {{ block.super }}{% endblock %}')
+
+        self.assertHTMLEqual("<section><header>Child Base</header></section>", template.render(Context()))
+
+    @override_settings(SLIPPERS_HOIST_STATIC_COMPONENTS=True)
+    def test_request_in_slots_not_hoisted(self):
+        reset_component_templates()
+        template = Template("{% slotted_path %}")
+
+        for path in ["/a/", "/b/"]:
+            with self.subTest(path=path):
+                request = RequestFactory().get(path)
+                self.assertIn(f"path={path}", template.render(RequestContext(request)))
+
+    def test_invalid_slots(self):
+        for source in [
+            "{% slot header %}{% endslot %}",
+            "{% #panel %}{% if True %}{% slot header %}{% endslot %}{% endif %}{% /panel %}",
+            "{% #panel %}{% slot header %}{% endslot %}{% slot header %}{% endslot %}{% /panel %}",
+            "{% #panel %}{% slot children %}{% endslot %}{% /panel %}",
+            "{% #panel %}{% slot %}{% endslot %}{% /panel %}",
+        ]:
+            with self.subTest(source=source):
+                with self.assertRaises(TemplateSyntaxError):
+                    Template(source)
+
+
+@override_settings(SLIPPERS_HOIST_STATIC_COMPONENTS=True)
+class HoistTest(TestCase):
+    def count_renders(self, template, context_factory=Context, renders=3):
+        with patch.object(
+            ComponentNode, "render_component", autospec=True, side_effect=ComponentNode.render_component
+        ) as mock_render_component:
+            outputs = {template.render(context_factory()) for _ in range(renders)}
+
+        self.assertEqual(1, len(outputs))
+        return mock_render_component.call_count
+
+    def test_constant_call_site_rendered_once(self):
+        template = Template('{% #card heading="Hello" %}<p>Static</p>{% /card %}')
+
+        self.assertTrue(template.nodelist[0].hoist)
+        self.assertEqual(1, self.count_renders(template))
+        self.assertHTMLEqual(
+            '<div class="card"><div class="card__header">Hello</div><div class="card__body"><p>Static</p></div></div>',
+            template.render(Context()),
+        )
+
+    def test_dynamic_call_sites_not_hoisted(self):
+        for source in [
+            "{% avatar user=user %}",
+            '{% #card heading="Hello" %}{{ body }}{% /card %}',
+            '{% avatar for user in users user="mixxorz" %}',
+        ]:
+            with self.subTest(source=source):
+                self.assertFalse(Template(source).nodelist[0].hoist)
+
+    def test_components_using_request_not_hoisted(self):
+        request = RequestFactory().get("/test-path/")
+
+        for source in ["{% request_component %}", "{% page_header %}"]:
+            with self.subTest(source=source):
+                template = Template(source)
+
+                self.assertGreaterEqual(self.count_renders(template, lambda: RequestContext(request)), 3)
+                self.assertIn("/test-path/", template.render(RequestContext(request)))
+
+    def test_template_change_renders_again(self):
+        template = Template('{% avatar user="mixxorz" %}')
+        template.render(Context())
+
+        reset_component_templates()
+
+        self.assertEqual(1, self.count_renders(template))
+
+    @override_settings(SLIPPERS_HOIST_STATIC_COMPONENTS=False)
+    def test_off_by_default(self):
+        self.assertFalse(Template('{% avatar user="mixxorz" %}').nodelist[0].hoist)
+
+
 @override_settings(SLIPPERS_RUNTIME_TYPE_CHECKING=True)
 class PropsTest(TestCase):
     def test_strips_out_front_matter(self):
@@ -263,6 +641,41 @@ class PropsTest(TestCase):
 
             self.assertTrue(mock_check_prop_types.called)
 
+    def test_constant_props_checked_once(self):
+        template = Template(
+            """
+            {% type_checking string="Hello" number=10 list_of_numbers=numbers string_or_number=True %}
+            """
+        )
+
+        with patch.object(PropValidator, "check_prop", autospec=True, side_effect=PropValidator.check_prop) as mock:
+            template.render(Context({"numbers": [1, 2, 3]}))
+            self.assertEqual(4, mock.call_count)
+
+            mock.reset_mock()
+
+            template.render(Context({"numbers": [1, 2, 3]}))
+            self.assertEqual(["list_of_numbers"], [call.args[1] for call in mock.call_args_list])
+
+    @patch("slippers.templatetags.slippers.render_error_html")
+    def test_constant_prop_errors(self, mock_render_error_html):
+        mock_render_error_html.return_value = ""
+
+        template = Template(
+            """
+            {% type_checking string=10 number="ten" list_of_numbers=numbers string_or_number=10 extra="foo" %}
+            """
+        )
+
+        for _ in range(2):
+            template.render(Context({"numbers": [1, 2, 3]}))
+
+            errors = mock_render_error_html.call_args[1]["errors"]
+            self.assertEqual(
+                [("invalid", "string"), ("invalid", "number"), ("extra", "extra")],
+                [(error.error, error.name) for error in errors],
+            )
+
     @patch("slippers.templatetags.slippers.render_error_html")
     def test_type_checking_output(self, mock_render_error_html):
         mock_render_error_html.return_value = ""
@@ -283,6 +696,43 @@ class PropsTest(TestCase):
             self.assertTrue(mock_render_error_html.called)
 
 
+@override_settings(SLIPPERS_RUNTIME_TYPE_CHECKING=False)
+class LoggedPropsTest(TestCase):
+    template = """
+        {% type_checking string=10 number=10 list_of_numbers=numbers string_or_number=10 %}
+    """
+
+    @override_settings(SLIPPERS_TYPE_CHECKING_WARMUP_RENDERS=2)
+    def test_warmup_renders(self):
+        template = Template(self.template)
+
+        with self.assertLogs("slippers", level="WARNING") as logs:
+            for _ in range(3):
+                output = template.render(Context({"numbers": [1, 2, 3]}))
+
+        self.assertEqual(2, len(logs.records))
+        self.assertIn("Invalid prop 'string' set on 'type_checking'. Expected 'str', got 'int'.", logs.output[0])
+        self.assertNotIn("slippersPropErrors", output)
+
+    @override_settings(SLIPPERS_TYPE_CHECKING_SAMPLE_RATE=0.5)
+    @patch("slippers.templatetags.slippers.random.random")
+    def test_sample_rate(self, mock_random):
+        template = Template(self.template)
+        mock_random.side_effect = [0.9, 0.1, 0.7]
+
+        with self.assertLogs("slippers", level="WARNING") as logs:
+            for _ in range(3):
+                template.render(Context({"numbers": [1, 2, 3]}))
+
+        self.assertEqual(1, len(logs.records))
+
+    @patch("slippers.templatetags.slippers.check_prop_types")
+    def test_disabled_by_default(self, mock_check_prop_types):
+        Template(self.template).render(Context({"numbers": [1, 2, 3]}))
+
+        self.assertFalse(mock_check_prop_types.called)
+
+
 class ErrorUITest(TestCase):
     def test_render_error_ui(self):
         template = """
@@ -482,6 +932,25 @@ class AttrsTagTest(TestCase):
             output,
         )
 
+    def test_legacy_warning_at_parse_time(self):
+        with self.assertWarns(DeprecationWarning):
+            template = Template("<input {% attrs aria_label %}>")
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            output = template.render(Context({"aria_label": "Search"}))
+
+        self.assertHTMLEqual('<input aria-label="Search">', output)
+
+    def test_literal_values(self):
+        template = Template('<input {% attrs type="text" required=True hidden=False name maxlength=10 %}>')
+
+        self.assertEqual(3, len(template.nodelist[1].segments))
+        self.assertHTMLEqual(
+            '<input type="text" required name="q" maxlength="10">', template.render(Context({"name": "q"}))
+        )
+        self.assertHTMLEqual('<input type="text" required maxlength="10">', template.render(Context()))
+
 
 class VarTagTest(TestCase):
     def test_basic(self):
@@ -590,6 +1059,38 @@ class MatchFilterTest(TestCase):
 
         self.assertHTMLEqual(expected, Template(template).render(context))
 
+    def test_mapping_parsed_once(self):
+        parse_match_mapping.cache_clear()
+        template = Template('{{ variant|match:"outline:btn-outline,ghost:btn-ghost" }}')
+
+        for variant in ["outline", "ghost", "outline"]:
+            template.render(Context({"variant": variant}))
+
+        self.assertEqual(1, parse_match_mapping.cache_info().misses)
+
+    def test_tag(self):
+        template = Template(
+            '<button class="{% match variant "outline:btn-outline,ghost:btn-ghost" %}">Click me</button>'
+        )
+
+        self.assertHTMLEqual(
+            '<button class="btn-ghost">Click me</button>', template.render(Context({"variant": "ghost"}))
+        )
+        self.assertHTMLEqual('<button class="">Click me</button>', template.render(Context({"variant": "square"})))
+
+    def test_tag_assigned_to_variable(self):
+        template = Template('{% match variant "outline:btn-outline,ghost:btn-ghost" as cls %}<i class="{{ cls }}"></i>')
+
+        self.assertHTMLEqual('<i class="btn-outline"></i>', template.render(Context({"variant": "outline"})))
+
+    def test_tag_syntax_error_at_parse_time(self):
+        with self.assertRaises(TemplateSyntaxError):
+            Template('{% match "foo" "outline:btn-outline,foo:bar:baz,,:apple,:orange" %}')
+
+    def test_tag_mapping_must_be_literal(self):
+        with self.assertRaisesMessage(TemplateSyntaxError, "The mapping passed to match must be a string literal."):
+            Template("{% match variant mapping %}")
+
 
 class FragmentTagTest(TestCase):
     def test_basic(self):
@@ -641,6 +1142,56 @@ class FragmentTagTest(TestCase):
 
         self.assertHTMLEqual(expected, Template(template).render(context))
 
+    def test_lazy_not_rendered_unless_used(self):
+        loads = []
+        template = Template(
+            "{% fragment as details lazy %}<p>{{ load }}</p>{% endfragment %}{% if show %}{{ details }}{% endif %}"
+        )
+        context = {"load": lambda: loads.append(1) or "Details"}
+
+        self.assertEqual("", template.render(Context({**context, "show": False})))
+        self.assertEqual([], loads)
+
+        self.assertEqual("<p>Details</p>", template.render(Context({**context, "show": True})))
+        self.assertEqual([1], loads)
+
+    def test_lazy_renders_context_as_defined(self):
+        template = Template(
+            '{% fragment as greeting lazy %}<b>Hello, {{ name }}</b>{% endfragment %}{% var name="Grace" %}'
+            "{{ greeting }} {{ name }}"
+        )
+
+        self.assertEqual("<b>Hello, &lt;Ada&gt;</b> Grace", template.render(Context({"name": "<Ada>"})))
+
+    def test_lazy_escaped_like_eager(self):
+        for source in ['{{ greeting|slice:":12" }}', "{{ greeting|first }}"]:
+            with self.subTest(source=source):
+                outputs = [
+                    Template(fragment + "<b>{{ name }}</b>{% endfragment %}" + source).render(
+                        Context({"name": "<Ada>"})
+                    )
+                    for fragment in ["{% fragment as greeting %}", "{% fragment as greeting lazy %}"]
+                ]
+
+                self.assertEqual(outputs[0], outputs[1])
+
+    @override_settings(SLIPPERS_RUNTIME_TYPE_CHECKING=True)
+    def test_lazy_passed_to_type_checked_component(self):
+        template = Template(
+            "{% fragment as label lazy %}<em>Hello</em>{% endfragment %}"
+            "{% type_checking string=label number=10 list_of_numbers=numbers string_or_number=label %}"
+        )
+
+        output = template.render(Context({"numbers": [1, 2]}))
+
+        self.assertIn("String: <em>Hello</em>", output)
+        self.assertNotIn("<script>", output)
+
+    @override_settings(DEBUG=True)
+    def test_lazy_syntax_error(self):
+        with self.assertRaises(TemplateSyntaxError):
+            Template("{% fragment as details eager %}{% endfragment %}")
+
 
 class RequestContextTest(TestCase):
     def setUp(self):
@@ -0,0 +1,68 @@
+import json
+import tempfile
+from pathlib import Path
+
+from django.template import Context, Template
+from django.template.loader import get_template
+from django.test import TestCase
+
+from slippers.tracing import trace
+
+
+class TracingTest(TestCase):
+    def test_records_span_tree(self):
+        template = Template('{% #card heading="Hi" %}{% avatar user="mixxorz" %}{% /card %}{% button %}')
+
+        with trace() as tracer:
+            template.render(Context())
+
+        self.assertEqual(["card", "button"], [span.name for span in tracer.roots])
+        card = tracer.roots[0]
+        self.assertEqual(["avatar"], [span.name for span in card.children])
+        self.assertLessEqual(card.children[0].duration, card.duration)
+
+    def test_spans_carry_origin(self):
+        with trace() as tracer:
+            get_template("profile_card.html").render({"user": "mixxorz"})
+
+        avatar = tracer.roots[0].children[0]
+        self.assertEqual("avatar.html", avatar.template_path)
+        self.assertEqual("profile_card.html", avatar.origin_template_name)
+        self.assertEqual(1, avatar.origin_lineno)
+
+    def test_loop_renders_nested_under_loop(self):
+        template = Template('{% #card for heading in headings heading=heading %}{% avatar user="a" %}{% /card %}')
+
+        with trace() as tracer:
+            template.render(Context({"headings": ["One", "Two"]}))
+
+        self.assertEqual(1, len(tracer.roots))
+        self.assertEqual(["avatar", "avatar"], [span.name for span in tracer.roots[0].children])
+
+    def test_not_recorded_outside_trace(self):
+        template = Template('{% avatar user="mixxorz" %}')
+
+        with trace() as tracer:
+            pass
+        template.render(Context())
+
+        self.assertEqual([], tracer.roots)
+
+    def test_chrome_trace_export(self):
+        template = Template('{% #card heading="Hi" %}{% avatar user="mixxorz" %}{% /card %}')
+
+        with trace() as tracer:
+            template.render(Context())
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "trace.json"
+            tracer.export(path)
+            events = json.loads(path.read_text())["traceEvents"]
+
+        self.assertEqual(["card", "avatar"], [event["name"] for event in events])
+        card, avatar = events
+        self.assertEqual("X", card["ph"])
+        self.assertEqual("card.html", card["args"]["template_path"])
+        self.assertIn("origin_lineno", card["args"])
+        self.assertGreaterEqual(avatar["ts"], card["ts"])
+        self.assertLessEqual(avatar["ts"] + avatar["dur"], card["ts"] + card["dur"])